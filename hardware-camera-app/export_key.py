@@ -6,31 +6,29 @@ import os
 from pathlib import Path
 
 try:
-    from hardware_identity import get_hardware_identity
+    from hardware_identity import derive_raw
+    
+    # --no-verify exports straight from the key cache without re-deriving the key pair
+    no_verify = '--no-verify' in sys.argv[1:]
+    args = [arg for arg in sys.argv[1:] if arg != '--no-verify']
     
     camera_id = None
-    if len(sys.argv) > 1:
-        camera_id = sys.argv[1]
+    if args:
+        camera_id = args[0]
     elif 'CAMERA_ID' in os.environ:
         camera_id = os.environ['CAMERA_ID']
     
-    if not camera_id:
-        try:
-            hw_id_temp = get_hardware_identity()
-            camera_id = hw_id_temp.get_camera_id()
-            if camera_id:
-                print(f"Using existing camera ID: {camera_id}", file=sys.stderr)
-        except:
-            pass
-    
-    hw_id = get_hardware_identity(camera_id=camera_id)
-    private_key_hex = hw_id.private_key.to_string().hex()
+    # Only the raw secret and public key are exported, so skip building a signing
+    # key; without an explicit camera_id the existing identity is reused as-is.
+    seed, pubkey_xy, address, resolved_camera_id = derive_raw(camera_id=camera_id, verify=not no_verify)
+    if not camera_id and resolved_camera_id:
+        print(f"Using existing camera ID: {resolved_camera_id}", file=sys.stderr)
     
     export_data = {
-        'privateKey': f'0x{private_key_hex}',
-        'address': hw_id.get_address(),
-        'cameraId': hw_id.get_camera_id(),
-        'publicKey': hw_id.get_public_key_hex()
+        'privateKey': f'0x{seed.hex()}',
+        'address': address,
+        'cameraId': resolved_camera_id,
+        'publicKey': pubkey_xy.hex()
     }
     
     export_file = Path(os.getenv('DEVICE_KEY_EXPORT_PATH', str(Path(__file__).parent / '.device_key_export')))
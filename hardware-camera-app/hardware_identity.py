@@ -2,49 +2,230 @@
 
 import os
 import hashlib
-import subprocess
 import stat
+import json
+import tempfile
+import functools
+import importlib.util
+import logging
 from pathlib import Path
 
-try:
-    from ecdsa import SigningKey, SECP256k1, VerifyingKey
-    ECDSA_AVAILABLE = True
-except ImportError:
-    ECDSA_AVAILABLE = False
-    print("Warning: ecdsa library not available. Install with: pip3 install ecdsa")
-    print("   Hardware signing features will be disabled")
+logger = logging.getLogger(__name__)
 
-# Try to import keccak256 for Ethereum address calculation
-KECCAK_AVAILABLE = False
-try:
-    # Try pysha3 first (most common)
-    import sha3
-    KECCAK_AVAILABLE = True
-except ImportError:
+# Prefer coincurve (libsecp256k1 bindings); pure-Python ecdsa is the fallback.
+# Only probe for them here: the import itself is deferred to _load_crypto() so
+# cache-hit paths like export_key.py never pay for loading the EC library.
+COINCURVE_AVAILABLE = importlib.util.find_spec('coincurve') is not None
+ECDSA_AVAILABLE = importlib.util.find_spec('ecdsa') is not None
+if not (COINCURVE_AVAILABLE or ECDSA_AVAILABLE):
+    logger.warning("ecdsa library not available. Install with: pip3 install coincurve (or ecdsa). "
+                   "Hardware signing features will be disabled")
+
+_crypto = None
+
+def _load_crypto():
+    global _crypto
+    if _crypto is None:
+        if COINCURVE_AVAILABLE:
+            import coincurve
+            _crypto = coincurve
+        else:
+            import ecdsa
+            _crypto = ecdsa
+    return _crypto
+
+# hashlib goes straight to OpenSSL's optimized keccak when it was built with it
+HASHLIB_KECCAK_AVAILABLE = 'keccak_256' in hashlib.algorithms_available
+
+# Checked once here without importing anything; the backend itself is resolved
+# lazily by HardwareIdentity._load_keccak()
+KECCAK_AVAILABLE = (
+    HASHLIB_KECCAK_AVAILABLE
+    or importlib.util.find_spec('sha3') is not None
+    or importlib.util.find_spec('Crypto') is not None
+)
+if not KECCAK_AVAILABLE:
+    logger.warning("keccak256 not available. Install with: pip3 install pysha3. "
+                   "Address calculation will use SHA256 (won't match Ethereum addresses)")
+
+def _resolve_keccak256():
+    # Returns a zero-argument factory for a keccak256 hash object
+    if HASHLIB_KECCAK_AVAILABLE:
+        return functools.partial(hashlib.new, 'keccak_256')
+    
+    try:
+        import sha3
+        return sha3.keccak_256
+    except ImportError:
+        pass
+    
+    # pycryptodome is the slowest backend but keeps existing installs on keccak;
+    # falling through to SHA256 would silently change the device address.
     try:
-        # Try pycryptodome
         from Crypto.Hash import keccak
-        KECCAK_AVAILABLE = True
+        return functools.partial(keccak.new, digest_bits=256)
     except ImportError:
-        KECCAK_AVAILABLE = False
-        print("Warning: keccak256 not available. Install with: pip3 install pysha3")
-        print("   Address calculation will use SHA256 (won't match Ethereum addresses)")
+        return None
+
 
 SALT_PATH = os.getenv('SALT_PATH', '/boot/.device_salt')
 SALT_BACKUP_PATH = Path(os.getenv('SALT_BACKUP_PATH', str(Path.home() / ".lensmint" / ".device_salt_backup")))
+KEY_CACHE_DIR = Path(os.getenv('KEY_CACHE_DIR', str(Path.home() / ".lensmint" / "key_cache")))
+
+SECP256K1_ORDER = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
+
+def _legacy_digest(data):
+    # ecdsa's SigningKey.sign() hashes with SHA-1 by default. Left-padding the digest
+    # to 32 bytes gives libsecp256k1 the same integer, so both backends produce
+    # signatures over the same value and in the same 64-byte r||s format.
+    return hashlib.sha1(data).digest().rjust(32, b'\x00')
+
+def _compact_to_der(signature):
+    r = int.from_bytes(signature[:32], 'big')
+    s = int.from_bytes(signature[32:64], 'big')
+    # libsecp256k1 only accepts low-S signatures; ecdsa may have produced high-S ones
+    s = min(s, SECP256K1_ORDER - s)
+    
+    def der_int(value):
+        # One spare byte keeps the sign bit clear when the top bit is set
+        encoded = value.to_bytes((value.bit_length() + 8) // 8, 'big')
+        return b'\x02' + bytes([len(encoded)]) + encoded
+    
+    body = der_int(r) + der_int(s)
+    return b'\x30' + bytes([len(body)]) + body
+
+# Bump when the cache entry layout or the address derivation changes
+KEY_CACHE_VERSION = 2
+
+def _key_cache_path(seed):
+    return KEY_CACHE_DIR / f"{hashlib.sha256(seed).hexdigest()}.json"
+
+def _address_hash_name():
+    # The cached address is only valid for the hash that produced it; installing
+    # or losing a keccak backend changes the address for the same key.
+    return 'keccak256' if HardwareIdentity._load_keccak() is not None else 'sha256'
+
+def _load_cached_key(seed):
+    try:
+        with open(_key_cache_path(seed), 'r') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if cached.get('privateKey') != f"0x{seed.hex()}":
+        return None
+    if cached.get('version') != KEY_CACHE_VERSION or cached.get('addressHash') != _address_hash_name():
+        return None
+    if not cached.get('address') or not cached.get('publicKey'):
+        return None
+    return cached
+
+def _store_cached_key(seed, data):
+    # Write to a temp file in the same directory and rename over the target so a
+    # concurrent reader never sees a partially written cache entry.
+    try:
+        KEY_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=KEY_CACHE_DIR, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(data, f)
+            os.chmod(tmp_path, stat.S_IRUSR | stat.S_IWUSR)
+            os.replace(tmp_path, _key_cache_path(seed))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError as e:
+        logger.warning("Could not write key cache: %s", e)
+
+def _create_salt_file(path, salt):
+    # Create the file with owner-only permissions in the same syscall, so it is
+    # never visible with default permissions. Returns the salt that ends up on disk.
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL
+    mode = stat.S_IRUSR | stat.S_IWUSR
+    try:
+        fd = os.open(path, flags, mode)
+    except FileExistsError:
+        # Another process won the race; use its salt unless the file is truncated
+        with open(path, "rb") as f:
+            existing = f.read()
+        if len(existing) == 32:
+            return existing
+        os.unlink(path)
+        fd = os.open(path, flags, mode)
+    with os.fdopen(fd, "wb") as f:
+        f.write(salt)
+    return salt
+
+_logged_camera_ids = set()
+
+# Hardware identifiers are constant for the life of the boot, so cache them per
+# camera_id; re-instantiating HardwareIdentity then skips the /proc and /sys reads.
+@functools.lru_cache(maxsize=8)
+def _collect_hw_id(camera_id):
+    identifiers = []
+    
+    if camera_id:
+        identifiers.append(f"camera:{camera_id}")
+        logger.debug("Camera ID: %s", camera_id)
+    
+    try:
+        # Scan line by line in binary mode and stop at the first Serial entry;
+        # only the serial value itself gets decoded.
+        with open("/proc/cpuinfo", 'rb') as f:
+            for line in f:
+                if line.startswith(b'Serial'):
+                    serial = line.split(b':', 1)[1].strip().decode('ascii', 'replace')
+                    identifiers.append(f"serial:{serial}")
+                    logger.debug("CPU Serial: %s...", serial[:16])
+                    break
+    except Exception as e:
+        logger.debug("Could not read CPU serial: %s", e)
+    
+    for interface in ['wlan0', 'eth0']:
+        try:
+            mac_path = f"/sys/class/net/{interface}/address"
+            with open(mac_path, 'r') as f:
+                mac = f.read().strip()
+                identifiers.append(f"mac:{mac}")
+                logger.debug("MAC Address (%s): %s", interface, mac)
+                break
+        except Exception as e:
+            continue
+    
+    try:
+        with open("/etc/machine-id", 'r') as f:
+            machine_id = f.read().strip()
+            identifiers.append(f"machine:{machine_id}")
+            logger.debug("Machine ID: %s...", machine_id[:16])
+    except Exception as e:
+        pass
+    
+    if not identifiers:
+        raise RuntimeError("Could not collect any hardware identifiers")
+    
+    logger.debug("Hardware ID components: %d found", len(identifiers))
+    
+    # A tuple, so the cached result can't be mutated by callers
+    return tuple(identifiers)
 
 class HardwareIdentity:
     
+    # keccak256 factory, resolved on first address calculation. Factories are
+    # partials or C types, so they don't bind as methods.
+    _keccak_new = None
+    _keccak_resolved = False
+    
     def __init__(self, camera_id=None):
         self.salt = None
-        self.private_key = None
-        self.public_key = None
-        self.address = None
+        self.salt_source = None
+        self._seed = None
+        self._private_key = None
+        self._public_key = None
+        self._key_verified = False
         self.initialized = False
         self.camera_id = camera_id
         
-        if not ECDSA_AVAILABLE:
-            raise RuntimeError("ecdsa library required. Install with: pip3 install ecdsa")
+        if not (COINCURVE_AVAILABLE or ECDSA_AVAILABLE):
+            raise RuntimeError("coincurve or ecdsa library required. Install with: pip3 install coincurve")
         
         self._initialize()
     
@@ -52,141 +233,195 @@ class HardwareIdentity:
         try:
             self.salt = self._get_or_create_salt()
             hw_id = self._get_hardware_id()
-            self.private_key, self.public_key = self._derive_key(hw_id, self.salt)
-            self.address = self._get_address()
+            self._seed = self._derive_seed(hw_id, self.salt)
+            
+            # The key material is fully determined by (hw_id, salt), so a cache hit
+            # lets us skip the SECP256k1 point multiplication until we actually sign.
+            cached = _load_cached_key(self._seed)
+            if cached is not None:
+                # Seed the cached properties directly from the cache entry
+                self.address = cached['address']
+                self.public_key_hex = cached['publicKey']
+            else:
+                self._derive_and_cache()
             
             self.initialized = True
-            print(f"Hardware identity initialized. Address: {self.address[:16]}...")
+            # Re-instantiating for the same camera shouldn't repeat the message
+            if self.camera_id not in _logged_camera_ids:
+                _logged_camera_ids.add(self.camera_id)
+                logger.info("Hardware identity initialized. Address: %s...", self.address[:16])
             
         except Exception as e:
-            print(f"Error initializing hardware identity: {e}")
+            logger.error("Error initializing hardware identity: %s", e)
             raise
     
     def _get_or_create_salt(self):
-        if os.path.exists(SALT_PATH):
-            try:
-                with open(SALT_PATH, "rb") as f:
-                    salt = f.read()
-                if len(salt) == 32:
-                    print(f"✓ Salt loaded from {SALT_PATH}")
-                    return salt
-            except PermissionError:
-                print(f"⚠ Permission denied reading {SALT_PATH}, trying backup...")
+        try:
+            with open(SALT_PATH, "rb") as f:
+                salt = f.read()
+            if len(salt) == 32:
+                logger.debug("Salt loaded from %s", SALT_PATH)
+                self.salt_source = SALT_PATH
+                return salt
+        except FileNotFoundError:
+            pass
+        except PermissionError:
+            logger.warning("Permission denied reading %s, trying backup...", SALT_PATH)
         
-        if SALT_BACKUP_PATH.exists():
-            try:
-                with open(SALT_BACKUP_PATH, "rb") as f:
-                    salt = f.read()
-                if len(salt) == 32:
-                    print(f"✓ Salt loaded from backup: {SALT_BACKUP_PATH}")
-                    return salt
-            except Exception as e:
-                print(f"⚠ Error reading backup salt: {e}")
+        try:
+            with open(SALT_BACKUP_PATH, "rb") as f:
+                salt = f.read()
+            if len(salt) == 32:
+                logger.debug("Salt loaded from backup: %s", SALT_BACKUP_PATH)
+                self.salt_source = str(SALT_BACKUP_PATH)
+                return salt
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning("Error reading backup salt: %s", e)
         
-        print("Creating new device salt...")
+        logger.info("Creating new device salt...")
         salt = os.urandom(32)
         
         try:
-            with open(SALT_PATH, "wb") as f:
-                f.write(salt)
-            os.chmod(SALT_PATH, stat.S_IRUSR | stat.S_IWUSR)
-            print(f"✓ Salt saved to {SALT_PATH} (read-only)")
+            salt = _create_salt_file(SALT_PATH, salt)
+            self.salt_source = SALT_PATH
+            logger.info("Salt saved to %s (read-only)", SALT_PATH)
         except (PermissionError, OSError) as e:
-            print(f"⚠ Cannot write to {SALT_PATH}: {e}")
-            print("   Saving to user directory instead...")
+            logger.warning("Cannot write to %s: %s. Saving to user directory instead...", SALT_PATH, e)
             SALT_BACKUP_PATH.parent.mkdir(parents=True, exist_ok=True)
-            with open(SALT_BACKUP_PATH, "wb") as f:
-                f.write(salt)
-            os.chmod(SALT_BACKUP_PATH, stat.S_IRUSR | stat.S_IWUSR)
-            print(f"✓ Salt saved to backup: {SALT_BACKUP_PATH}")
+            salt = _create_salt_file(SALT_BACKUP_PATH, salt)
+            self.salt_source = str(SALT_BACKUP_PATH)
+            logger.info("Salt saved to backup: %s", SALT_BACKUP_PATH)
         
         return salt
     
     def _get_hardware_id(self):
-        identifiers = []
-        
-        if self.camera_id:
-            identifiers.append(f"camera:{self.camera_id}")
-            print(f"✓ Camera ID: {self.camera_id}")
-        
-        try:
-            result = subprocess.run(
-                ["cat", "/proc/cpuinfo"],
-                capture_output=True,
-                text=True,
-                timeout=2
-            )
-            for line in result.stdout.split('\n'):
-                if 'Serial' in line:
-                    serial = line.split(':')[1].strip()
-                    identifiers.append(f"serial:{serial}")
-                    print(f"✓ CPU Serial: {serial[:16]}...")
-                    break
-        except Exception as e:
-            print(f"⚠ Could not read CPU serial: {e}")
-        
-        for interface in ['wlan0', 'eth0']:
-            try:
-                mac_path = f"/sys/class/net/{interface}/address"
-                if os.path.exists(mac_path):
-                    with open(mac_path, 'r') as f:
-                        mac = f.read().strip()
-                        identifiers.append(f"mac:{mac}")
-                        print(f"✓ MAC Address ({interface}): {mac}")
-                        break
-            except Exception as e:
-                continue
+        return _collect_hw_id(self.camera_id)
+    
+    def _derive_seed(self, hw_id, salt):
+        # Streams sha256("|".join(hw_id) + salt) without building the joined string
+        h = hashlib.sha256()
+        for i, identifier in enumerate(hw_id):
+            if i:
+                h.update(b'|')
+            h.update(identifier.encode('utf-8'))
+        h.update(salt)
+        return h.digest()
+    
+    def _derive_key(self, seed):
+        crypto = _load_crypto()
+        if COINCURVE_AVAILABLE:
+            private_key = crypto.PrivateKey(seed)
+            return private_key, private_key.public_key
+        private_key = crypto.SigningKey.from_string(seed, curve=crypto.SECP256k1)
+        public_key = private_key.get_verifying_key()
+        return private_key, public_key
+    
+    def _derive_public_key(self, seed):
+        # Just the public point for address checks; the signing key object is
+        # only built by the private_key property, on the first sign.
+        crypto = _load_crypto()
+        if COINCURVE_AVAILABLE:
+            return crypto.PublicKey.from_valid_secret(seed)
+        point = crypto.SECP256k1.generator * int.from_bytes(seed, 'big')
+        return crypto.VerifyingKey.from_public_point(point, curve=crypto.SECP256k1)
+    
+    def _derive_and_cache(self):
+        self._public_key = self._derive_public_key(self._seed)
+        for name in ('_pubkey_xy', 'address', 'public_key_hex'):
+            self.__dict__.pop(name, None)
+        _store_cached_key(self._seed, {
+            'version': KEY_CACHE_VERSION,
+            'addressHash': _address_hash_name(),
+            'privateKey': f"0x{self._seed.hex()}",
+            'address': self.address,
+            'publicKey': self.public_key_hex
+        })
+        self._key_verified = True
+    
+    @property
+    def private_key(self):
+        if self._private_key is None and self._seed is not None:
+            self._private_key, self._public_key = self._derive_key(self._seed)
+        return self._private_key
+    
+    @property
+    def public_key(self):
+        if self._public_key is None and self._seed is not None:
+            self._public_key = self._derive_public_key(self._seed)
+        return self._public_key
+    
+    def verify_key_cache(self):
+        """Re-derive the public key and check it against the cached address."""
+        if not self.initialized:
+            raise RuntimeError("Hardware identity not initialized")
         
-        try:
-            if os.path.exists("/etc/machine-id"):
-                with open("/etc/machine-id", 'r') as f:
-                    machine_id = f.read().strip()
-                    identifiers.append(f"machine:{machine_id}")
-                    print(f"✓ Machine ID: {machine_id[:16]}...")
-        except Exception as e:
-            pass
+        # Already derived in this process, nothing to check against
+        if self._key_verified:
+            return True
         
-        if not identifiers:
-            raise RuntimeError("Could not collect any hardware identifiers")
+        cached_address = self.address
+        self._derive_and_cache()
+        if cached_address != self.address:
+            logger.warning("Key cache was stale, rewritten for %s...", self.address[:16])
+            return False
+        return True
+    
+    @classmethod
+    def _load_keccak(cls):
+        if not cls._keccak_resolved:
+            cls._keccak_new = _resolve_keccak256() if KECCAK_AVAILABLE else None
+            cls._keccak_resolved = True
+        return cls._keccak_new
+    
+    @functools.cached_property
+    def _pubkey_xy(self):
+        """
+        Canonical public key serialization: the 64-byte X||Y point without the
+        0x04 SEC1 prefix. Ethereum addresses and publicKey exports are both
+        derived from this form, so every backend must go through here.
+        """
+        if self._seed is None:
+            raise RuntimeError("Hardware identity not initialized")
         
-        hw_string = "|".join(identifiers)
-        print(f"Hardware ID components: {len(identifiers)} found")
+        if COINCURVE_AVAILABLE:
+            pub_key_bytes = self.public_key.format(compressed=False)[1:]
+        else:
+            pub_key_bytes = self.public_key.to_string()
         
-        return hw_string.encode('utf-8')
+        if len(pub_key_bytes) != 64:
+            raise RuntimeError(f"Unexpected public key length: {len(pub_key_bytes)}")
+        return pub_key_bytes
     
-    def _derive_key(self, hw_id, salt):
-        combined = hw_id + salt
-        seed = hashlib.sha256(combined).digest()
-        private_key = SigningKey.from_string(seed, curve=SECP256k1)
-        public_key = private_key.get_verifying_key()
-        return private_key, public_key
+    @functools.cached_property
+    def address(self):
+        return self._get_address()
+    
+    @functools.cached_property
+    def public_key_hex(self):
+        return self._pubkey_xy.hex()
     
     def _get_address(self):
-        pub_key_bytes = self.public_key.to_string()
+        pub_key_bytes = self._pubkey_xy
         
-        if KECCAK_AVAILABLE:
-            try:
-                # Try pysha3
-                try:
-                    import sha3
-                    k = sha3.keccak_256()
-                    k.update(pub_key_bytes)
-                    hash_bytes = k.digest()
-                except:
-                    from Crypto.Hash import keccak
-                    k = keccak.new(digest_bits=256)
-                    k.update(pub_key_bytes)
-                    hash_bytes = k.digest()
-                
-                address = hash_bytes[-20:].hex()
-                return f"0x{address}"
-            except Exception as e:
-                print(f"Warning: keccak256 calculation failed: {e}, using SHA256 fallback")
+        keccak_new = self._load_keccak()
+        if keccak_new is not None:
+            k = keccak_new()
+            k.update(pub_key_bytes)
+            address = k.digest()[-20:].hex()
+            return f"0x{address}"
         
+        # The missing-keccak warning was already printed once at import
         address_hash = hashlib.sha256(pub_key_bytes).hexdigest()[:40]
-        print("⚠️ Using SHA256 for address (install pysha3 for keccak256)")
         return f"0x{address_hash}"
     
+    def _sign(self, data):
+        if COINCURVE_AVAILABLE:
+            # Drop the recovery id to keep the 64-byte r||s format ecdsa produces
+            return self.private_key.sign_recoverable(_legacy_digest(data), hasher=None)[:64]
+        return self.private_key.sign(data)
+    
     def sign_data(self, data):
         if not self.initialized:
             raise RuntimeError("Hardware identity not initialized")
@@ -194,10 +429,19 @@ class HardwareIdentity:
         if isinstance(data, str):
             data = data.encode('utf-8')
         
-        signature = self.private_key.sign(data)
+        signature = self._sign(data)
         return signature
     
     def sign_hash(self, data_hash):
+        return self.sign_hashes([data_hash])[0]
+    
+    def sign_hash_raw(self, data_hash):
+        """
+        Sign a hash and return the raw 64-byte r||s signature.
+        
+        For callers that hex/base64-encode at their own boundary instead of
+        taking sign_hash()'s hex string.
+        """
         if not self.initialized:
             raise RuntimeError("Hardware identity not initialized")
         
@@ -205,14 +449,34 @@ class HardwareIdentity:
             # Assume hex string
             data_hash = bytes.fromhex(data_hash.replace('0x', ''))
         
-        signature = self.private_key.sign(data_hash)
+        return self._sign(data_hash)
+    
+    def sign_hashes(self, data_hashes):
+        """
+        Sign a batch of hashes (bytes or hex strings), e.g. a burst of photos.
         
-        return {
-            'signature': signature.hex(),
-            'address': self.address,
-            'algorithm': 'ECDSA_SECP256k1',
-            'salt_path': SALT_PATH if os.path.exists(SALT_PATH) else str(SALT_BACKUP_PATH)
-        }
+        The per-instance fields are computed once for the whole batch.
+        
+        Returns:
+            list: One sign_hash() style dict per input hash, in order
+        """
+        if not self.initialized:
+            raise RuntimeError("Hardware identity not initialized")
+        
+        address = self.address
+        salt_path = self.salt_source
+        
+        results = []
+        for data_hash in data_hashes:
+            signature = self.sign_hash_raw(data_hash)
+            results.append({
+                'signature': signature.hex(),
+                'address': address,
+                'algorithm': 'ECDSA_SECP256k1',
+                'salt_path': salt_path
+            })
+        
+        return results
     
     def verify_signature(self, data, signature):
         if not self.initialized:
@@ -225,15 +489,22 @@ class HardwareIdentity:
             signature = bytes.fromhex(signature.replace('0x', ''))
         
         try:
+            if COINCURVE_AVAILABLE:
+                if len(signature) != 64:
+                    return False
+                return self.public_key.verify(_compact_to_der(signature), _legacy_digest(data), hasher=None)
             self.public_key.verify(signature, data)
             return True
         except Exception:
             return False
     
     def get_public_key_hex(self):
+        return self.public_key_hex
+    
+    def get_private_key_hex(self):
         if not self.initialized:
             return None
-        return self.public_key.to_string().hex()
+        return self._seed.hex()
     
     def get_address(self):
         return self.address
@@ -246,7 +517,7 @@ class HardwareIdentity:
             'address': self.address,
             'camera_id': self.camera_id,
             'public_key_hex': self.get_public_key_hex(),
-            'salt_path': SALT_PATH if os.path.exists(SALT_PATH) else str(SALT_BACKUP_PATH),
+            'salt_path': self.salt_source,
             'initialized': self.initialized
         }
 
@@ -260,7 +531,30 @@ def get_hardware_identity(camera_id=None):
         _hardware_identity = HardwareIdentity(camera_id=camera_id)
     return _hardware_identity
 
+def derive_raw(camera_id=None, verify=True):
+    """
+    Return the raw key material for export without building a signing key object
+    unless it is needed.
+    
+    With verify=False a key-cache hit is returned as-is; otherwise the public key
+    is re-derived once to check the cache.
+    
+    Returns:
+        tuple: (seed_bytes, pubkey_xy_bytes, address_hex, camera_id)
+    """
+    identity = get_hardware_identity(camera_id=camera_id)
+    if verify:
+        identity.verify_key_cache()
+    return (
+        identity._seed,
+        bytes.fromhex(identity.public_key_hex),
+        identity.address,
+        identity.camera_id
+    )
+
 if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+    
     print("=" * 60)
     print("Hardware Identity Test")
     print("=" * 60)
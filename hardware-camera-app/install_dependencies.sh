@@ -123,7 +123,9 @@ if [ "$use_venv" = "y" ] || [ "$use_venv" = "Y" ]; then
     echo ""
     echo "Installing additional libraries..."
     pip install smbus2 || echo "Warning: smbus2 install failed"
+    pip install coincurve || echo "Warning: coincurve install failed (falling back to ecdsa)"
     pip install ecdsa || echo "Warning: ecdsa install failed (required for hardware identity)"
+    pip install orjson || echo "Warning: orjson install failed (falling back to json)"
 
     echo ""
     echo -e "${GREEN}Virtual environment created at: $VENV_PATH${NC}"
@@ -146,7 +148,9 @@ else
     echo ""
     echo "Installing additional libraries..."
     pip3 install --user smbus2 || echo "Warning: smbus2 install failed"
+    pip3 install --user coincurve || echo "Warning: coincurve install failed (falling back to ecdsa)"
     pip3 install --user ecdsa || echo "Warning: ecdsa install failed (required for hardware identity)"
+    pip3 install --user orjson || echo "Warning: orjson install failed (falling back to json)"
 fi
 echo ""
 
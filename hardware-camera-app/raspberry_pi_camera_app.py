@@ -5,12 +5,21 @@ import time
 from datetime import datetime
 from pathlib import Path
 import threading
+import contextlib
+import queue
+import concurrent.futures
+from functools import partial
 import numpy as np
 import cv2
 import hashlib
 import json
+import re
+import subprocess
+import socket
+from urllib.parse import urlparse
 import requests
-from io import BytesIO
+from requests.adapters import HTTPAdapter
+import urllib3
 import logging
 from logging import Filter
 
@@ -33,9 +42,11 @@ Config.set('kivy', 'log_level', os.getenv('KIVY_LOG_LEVEL', 'info'))
 from kivy.app import App
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.floatlayout import FloatLayout
-from kivy.uix.gridlayout import GridLayout
-from kivy.uix.scrollview import ScrollView
+from kivy.uix.recycleview import RecycleView
+from kivy.uix.recycleview.views import RecycleDataViewBehavior
+from kivy.uix.recyclegridlayout import RecycleGridLayout
 from kivy.uix.button import Button
+from kivy.uix.widget import Widget
 from kivy.uix.label import Label
 from kivy.uix.image import Image
 from kivy.clock import Clock
@@ -43,13 +54,13 @@ from kivy.core.window import Window
 from kivy.graphics.texture import Texture
 from kivy.graphics import Color, Rectangle
 from kivy.uix.screenmanager import ScreenManager, Screen
-import glob
 
 # Camera imports
 try:
     from picamera2 import Picamera2
     from picamera2.encoders import H264Encoder
     from picamera2.outputs import FileOutput
+    from libcamera import Transform
     CAMERA_AVAILABLE = True
 except ImportError:
     CAMERA_AVAILABLE = False
@@ -66,25 +77,23 @@ class ThrottledFilter(Filter):
         super().__init__()
         self.pattern = pattern
         self.interval = interval
-        self.last_log_time = {}
+        self._last = None
     
     def filter(self, record):
-        message = record.getMessage()
-        if self.pattern in message:
-            key = self.pattern
-            now = time.time()
-            
-            if key not in self.last_log_time:
-                self.last_log_time[key] = now
-                return True
-            
-            if now - self.last_log_time[key] >= self.interval:
-                self.last_log_time[key] = now
-                return True
-            
-            return False
+        # Match against the unformatted template so records we don't care
+        # about (the common case) never pay for getMessage()'s % formatting
+        msg = record.msg
+        if not isinstance(msg, str):
+            msg = record.getMessage()
+        if self.pattern not in msg:
+            return True
         
-        return True
+        now = time.monotonic()
+        if self._last is None or now - self._last >= self.interval:
+            self._last = now
+            return True
+        
+        return False
 
 logging.basicConfig(level=logging.INFO)
 
@@ -100,11 +109,46 @@ for handler in logging.root.handlers:
 picamera2_logger = logging.getLogger('picamera2')
 picamera2_logger.setLevel(logging.INFO)
 
+# Gallery/viewer navigation is chatty; at the default INFO level its debug
+# lines cost one level check instead of a console write
+gallery_logger = logging.getLogger('camera.gallery')
+
 CAPTURE_DIR = Path(os.getenv('CAPTURE_DIR', str(Path.home() / "captures")))
 CAPTURE_DIR.mkdir(parents=True, exist_ok=True)
 
+# Gallery thumbnails, kept out of the photo_*.jpg namespace
+THUMB_DIR = CAPTURE_DIR / '.thumbnails'
+THUMB_DIR.mkdir(parents=True, exist_ok=True)
+THUMB_SIZE = int(os.getenv('THUMB_SIZE', '256'))
+# Screen-sized copies for the full screen viewer (long edge, in pixels)
+VIEW_DIR = CAPTURE_DIR / '.views'
+VIEW_DIR.mkdir(parents=True, exist_ok=True)
+VIEW_SIZE = int(os.getenv('VIEW_SIZE', '1280'))
+# Deleted files are renamed in here (cheap) and unlinked in the background
+TRASH_DIR = CAPTURE_DIR / '.trash'
+TRASH_DIR.mkdir(parents=True, exist_ok=True)
+# Disk budgets for the derived copies above; least recently used go first
+THUMB_CACHE_BYTES = int(os.getenv('THUMB_CACHE_MB', '64')) * 1024 * 1024
+VIEW_CACHE_BYTES = int(os.getenv('VIEW_CACHE_MB', '256')) * 1024 * 1024
+# Parallel thumbnail backfill; capped so the camera and uploads keep a core
+THUMB_WORKERS = int(os.getenv('THUMB_WORKERS', str(min(2, os.cpu_count() or 1))))
+# photo_/video_ + "%Y%m%d_%H%M%S" timestamp, as written by CameraController
+_MEDIA_NAME_RE = re.compile(r'^(?:photo|video)_(\d{8})_(\d{6})')
+
 BACKEND_URL = os.getenv('BACKEND_URL', 'http://localhost:5000')
 CLAIM_POLL_INTERVAL = int(os.getenv('CLAIM_POLL_INTERVAL', '5'))
+# Saved photos waiting for (or in) sign + upload before the shutter reports busy
+MAX_PENDING_UPLOADS = int(os.getenv('MAX_PENDING_UPLOADS', '4'))
+
+# Balance checks/polls go straight through urllib3: one keep-alive pool to
+# the backend, without requests' per-call PreparedRequest/cookie overhead
+POOL = urllib3.PoolManager(num_pools=2, maxsize=2, retries=urllib3.Retry(0))
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 try:
     import qrcode
@@ -123,6 +167,144 @@ ZOOM_STEP = float(os.getenv('ZOOM_STEP', '0.5'))
 
 CAMERA_ROTATION = int(os.getenv('CAMERA_ROTATION', '90'))
 
+# The ISP can only flip (0/180); 90/270 still need a rotation on the CPU
+ISP_ROTATION = 180 if CAMERA_ROTATION == 180 else 0
+SOFTWARE_ROTATION = 0 if CAMERA_ROTATION == 180 else CAMERA_ROTATION
+ROTATE_CODES = {
+    90: cv2.ROTATE_90_CLOCKWISE,
+    270: cv2.ROTATE_90_COUNTERCLOCKWISE,
+}
+
+# The preview is rotated for free by sampling the unrotated texture with
+# permuted coordinates. Order is the rectangle's bottom-left, bottom-right,
+# top-right, top-left corners; v=0 is the frame's first (top) row, so these
+# also undo the top-down row order that used to need a per-frame flip.
+PREVIEW_TEX_COORDS = {
+    0: (0, 1, 1, 1, 1, 0, 0, 0),
+    90: (1, 1, 1, 0, 0, 0, 0, 1),
+    270: (0, 0, 0, 1, 1, 1, 1, 0),
+}
+
+def _file_sha256(f):
+    """SHA-256 of an open binary file, read in chunks rather than all at once."""
+    if hasattr(hashlib, 'file_digest'):  # Python 3.11+
+        return hashlib.file_digest(f, 'sha256')
+    h = hashlib.sha256()
+    for chunk in iter(lambda: f.read(1 << 16), b''):
+        h.update(chunk)
+    return h
+
+def _sync_text_size(widget, size):
+    """Shared size -> text_size binding so labels wrap to their box."""
+    widget.text_size = size
+
+def _thumbnail_path(filepath):
+    return THUMB_DIR / os.path.basename(filepath)
+
+def _view_path(filepath):
+    return VIEW_DIR / os.path.basename(filepath)
+
+def _write_scaled_jpeg(array, out_path, max_side, quality=80):
+    """
+    Downscale a BGR image to fit max_side and save it as a JPEG.
+
+    Returns the downscaled array so a smaller copy can be made from it.
+    """
+    h, w = array.shape[:2]
+    scale = max_side / max(w, h)
+    if scale < 1:
+        array = cv2.resize(
+            array,
+            (max(1, round(w * scale)), max(1, round(h * scale))),
+            interpolation=cv2.INTER_AREA
+        )
+    ok, buf = cv2.imencode('.jpg', array, [cv2.IMWRITE_JPEG_QUALITY, quality])
+    if not ok:
+        raise RuntimeError("JPEG encoding failed")
+    # Write then rename so the gallery never picks up a half-written file
+    tmp_path = f"{out_path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(buf)
+    os.replace(tmp_path, out_path)
+    return array
+
+def _write_thumbnail(array, thumb_path):
+    return _write_scaled_jpeg(array, thumb_path, THUMB_SIZE, 80)
+
+def _prune_derived_dir(directory, live_names, budget, older_than):
+    """
+    Trim a thumbnail/view directory: drop copies whose photo is gone, then
+    the least recently used ones until it fits the byte budget.
+
+    Files modified at or after older_than are left alone, since they may
+    belong to photos captured after live_names was listed. Returns the
+    names that were removed.
+    """
+    removed = []
+    kept = []
+    total = 0
+    with os.scandir(directory) as it:
+        for entry in it:
+            if not entry.is_file() or entry.name.endswith('.tmp'):
+                continue
+            st = entry.stat()
+            if st.st_mtime >= older_than:
+                continue
+            if entry.name not in live_names:
+                removed.append(entry.name)
+                continue
+            # relatime only updates atime occasionally; mtime covers new files
+            kept.append((max(st.st_atime, st.st_mtime), st.st_size, entry.name))
+            total += st.st_size
+
+    if total > budget:
+        kept.sort()
+        for _, size, name in kept:
+            if total <= budget:
+                break
+            removed.append(name)
+            total -= size
+
+    for name in removed:
+        try:
+            os.remove(os.path.join(directory, name))
+        except FileNotFoundError:
+            pass
+    return removed
+
+def _move_to_trash(path):
+    """Rename a file into TRASH_DIR; a same-filesystem rename is metadata only."""
+    os.rename(path, TRASH_DIR / f"{os.path.basename(path)}.{time.time_ns()}")
+
+def _empty_trash():
+    with os.scandir(TRASH_DIR) as it:
+        for entry in it:
+            try:
+                os.remove(entry.path)
+            except OSError as e:
+                gallery_logger.warning("Could not remove %s: %s", entry.path, e)
+
+def _iter_multipart(boundary, fields, name, filename, content_type, body, chunk_size=1 << 16):
+    """
+    Yield a multipart/form-data body piece by piece (sent chunked).
+
+    body is the file part's content, either bytes or a binary file object;
+    it is never copied into one contiguous payload.
+    """
+    for key, value in fields.items():
+        yield (f'--{boundary}\r\nContent-Disposition: form-data; name="{key}"\r\n\r\n'
+               f'{value}\r\n').encode()
+    yield (f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"; filename="{filename}"\r\n'
+           f'Content-Type: {content_type}\r\n\r\n').encode()
+    if isinstance(body, (bytes, bytearray)):
+        # Slices must be real bytes: urllib3's chunked writer rejects memoryviews
+        for i in range(0, len(body), chunk_size):
+            yield bytes(body[i:i + chunk_size])
+    else:
+        for chunk in iter(lambda: body.read(chunk_size), b''):
+            yield chunk
+    yield f'\r\n--{boundary}--\r\n'.encode()
+
 class BatteryMonitor:
 
     def __init__(self):
@@ -143,24 +325,35 @@ class BatteryMonitor:
                 print(f"Battery monitor: Initialization failed ({e}), using simulation")
                 self.simulated = True
 
-    def get_battery_level(self):
-        if self.simulated:
-            import random
-            return random.randint(75, 100)
+        if not self.simulated:
+            self._cached = self._read()
+            threading.Thread(target=self._poll_i2c, daemon=True).start()
 
+    def _poll_i2c(self):
+        while True:
+            time.sleep(5)
+            self._cached = self._read()
+
+    def _read(self):
         try:
             soc_data = self.bus.read_i2c_block_data(self.address, 0x06, 2)
             
+            # SMBus returns unsigned bytes, so only the upper bound needs clamping
             percentage = soc_data[0]
-            if percentage > 100:
-                percentage = 100
-            
-            return min(100, max(0, percentage))
+            return 100 if percentage > 100 else percentage
             
         except Exception as e:
             print(f"Battery read error: {e}")
             return 85
 
+    def get_battery_level(self):
+        if self.simulated:
+            import random
+            return random.randint(75, 100)
+
+        # Latest reading from the poller thread; no I2C I/O on the caller's thread
+        return self._cached
+
 class CameraController:
 
     def __init__(self):
@@ -171,6 +364,20 @@ class CameraController:
         self.sensor_size = None
         self.initialized = False
         self.camera_id = None
+        self._photo_queue = queue.Queue(maxsize=4)
+        threading.Thread(target=self._photo_writer_loop, daemon=True).start()
+        # (sequence, RGB frame) for the newest preview frame, replaced wholesale
+        # by the capture thread. Frames live in a small ring of preallocated
+        # buffers so the slot the UI may still be uploading is not overwritten.
+        self._latest = None
+        self._frame_bufs = [
+            np.empty((PREVIEW_SIZE[1], PREVIEW_SIZE[0], 3), dtype=np.uint8)
+            for _ in range(3)
+        ]
+        self._stream_thread = None
+        self._stream_stop = threading.Event()
+        # Coalesces rapid zoom presses into one set_controls per frame
+        self._zoom_trigger = Clock.create_trigger(self._apply_zoom)
 
     def initialize(self):
         if not CAMERA_AVAILABLE:
@@ -190,80 +397,33 @@ class CameraController:
             time.sleep(0.5)
             
             self.camera = Picamera2()
+            self.camera.configure(self._photo_configuration())
             self.camera.start()
 
             try:
                 sensor_props = self.camera.camera_properties
                 self.sensor_size = sensor_props.get('PixelArraySize', (2592, 1944))
                 
-                self.camera_id = None
-                
-                camera_parts = []
-                
-                if 'Model' in sensor_props and sensor_props.get('Model'):
-                    camera_parts.append(f"model:{sensor_props['Model']}")
-                
-                if 'SensorName' in sensor_props and sensor_props.get('SensorName'):
-                    camera_parts.append(f"sensor:{sensor_props['SensorName']}")
-                
-                if 'LensName' in sensor_props and sensor_props.get('LensName'):
-                    camera_parts.append(f"lens:{sensor_props['LensName']}")
-                
+                # The ID never changes for a given module, and working it out can
+                # fork libcamera-hello (hundreds of ms), so keep it on disk
+                cache_path = CAPTURE_DIR / ".camera_id"
                 try:
-                    import subprocess
-                    result = subprocess.run(
-                        ['cat', '/proc/device-tree/camera0/compatible'],
-                        capture_output=True,
-                        text=True,
-                        timeout=1
-                    )
-                    if result.returncode == 0 and result.stdout.strip():
-                        camera_parts.append(f"compatible:{result.stdout.strip()}")
-                except:
-                    pass
-                
-                if camera_parts:
-                    camera_id_str = "|".join(camera_parts)
-                    import hashlib
-                    self.camera_id = hashlib.sha256(camera_id_str.encode()).hexdigest()[:16]
-                    print(f"Camera ID generated from properties: {self.camera_id}")
-                    print(f"  Camera info: {camera_id_str[:80]}...")
-                
-                if not self.camera_id:
+                    self.camera_id = cache_path.read_text().strip() or None
+                except OSError:
+                    self.camera_id = None
+
+                if self.camera_id:
+                    print(f"Camera ID (cached): {self.camera_id}")
+                else:
+                    self.camera_id = self._compute_camera_id(sensor_props)
                     try:
-                        import subprocess
-                        result = subprocess.run(
-                            ['libcamera-hello', '--list-cameras'],
-                            capture_output=True,
-                            text=True,
-                            timeout=2
-                        )
-                        if result.returncode == 0 and result.stdout:
-                            for line in result.stdout.split('\n'):
-                                if 'serial' in line.lower():
-                                    parts = line.split()
-                                    for i, part in enumerate(parts):
-                                        if 'serial' in part.lower() and ':' in part:
-                                            serial_part = part.split(':')[-1] if ':' in part else part.split('=')[-1]
-                                            if serial_part and len(serial_part) > 3:
-                                                self.camera_id = serial_part.strip(':,=')
-                                                break
-                                    if self.camera_id:
-                                        break
-                    except:
-                        pass
-                
-                if not self.camera_id:
-                    import hashlib
-                    props_str = str(sorted(sensor_props.items()))
-                    props_str += f"|size:{self.sensor_size[0]}x{self.sensor_size[1]}"
-                    self.camera_id = hashlib.sha256(props_str.encode()).hexdigest()[:16]
-                    print(f"Camera ID generated from properties hash: {self.camera_id}")
+                        cache_path.write_text(self.camera_id)
+                    except OSError as e:
+                        print(f"Warning: Could not cache camera ID: {e}")
                 
             except Exception as e:
                 self.sensor_size = (2592, 1944)
                 print(f"Warning: Could not extract camera ID: {e}")
-                import hashlib
                 fallback = hashlib.sha256(f"camera_{time.time()}".encode()).hexdigest()[:16]
                 self.camera_id = fallback
 
@@ -275,17 +435,148 @@ class CameraController:
             print(f"Error initializing camera: {e}")
             return False
 
-    def get_frame(self):
-        if not self.initialized or self.camera is None:
-            return None
+    def _photo_configuration(self):
+        # Photos come from the full-resolution main stream; the preview reads
+        # the display-sized lores stream, which is YUV420 (1.5 bytes/pixel).
+        # picamera2's "RGB888" is B,G,R in memory, so cv2 can write it as-is.
+        return self.camera.create_video_configuration(
+            main={"size": PHOTO_SIZE, "format": "RGB888"},
+            lores={"size": PREVIEW_SIZE, "format": "YUV420"},
+            transform=Transform(hflip=1, vflip=1) if ISP_ROTATION == 180 else Transform()
+        )
 
+    def _recording_configuration(self):
+        # The H.264 encoder takes YUV420 natively, so record from a YUV main
+        # stream at VIDEO_SIZE rather than having it convert full-size RGB.
+        # The lores preview stream is unchanged.
+        return self.camera.create_video_configuration(
+            main={"size": VIDEO_SIZE, "format": "YUV420"},
+            lores={"size": PREVIEW_SIZE, "format": "YUV420"},
+            transform=Transform(hflip=1, vflip=1) if ISP_ROTATION == 180 else Transform()
+        )
+
+    def _compute_camera_id(self, sensor_props):
+        """Derive a stable camera ID from sensor properties (slow path, cached by initialize)."""
+        camera_id = None
+        
+        camera_parts = []
+        
+        if 'Model' in sensor_props and sensor_props.get('Model'):
+            camera_parts.append(f"model:{sensor_props['Model']}")
+        
+        if 'SensorName' in sensor_props and sensor_props.get('SensorName'):
+            camera_parts.append(f"sensor:{sensor_props['SensorName']}")
+        
+        if 'LensName' in sensor_props and sensor_props.get('LensName'):
+            camera_parts.append(f"lens:{sensor_props['LensName']}")
+        
         try:
-            frame = self.camera.capture_array()
-            return frame
-        except Exception as e:
-            return None
+            # Read the device tree node directly rather than forking cat
+            compatible = Path('/proc/device-tree/camera0/compatible').read_bytes().decode().strip()
+            if compatible:
+                camera_parts.append(f"compatible:{compatible}")
+        except:
+            pass
+        
+        if camera_parts:
+            camera_id_str = "|".join(camera_parts)
+            camera_id = hashlib.sha256(camera_id_str.encode()).hexdigest()[:16]
+            print(f"Camera ID generated from properties: {camera_id}")
+            print(f"  Camera info: {camera_id_str[:80]}...")
+        
+        if not camera_id:
+            try:
+                result = subprocess.run(
+                    ['libcamera-hello', '--list-cameras'],
+                    capture_output=True,
+                    text=True,
+                    timeout=2
+                )
+                if result.returncode == 0 and result.stdout:
+                    for line in result.stdout.split('\n'):
+                        if 'serial' in line.lower():
+                            parts = line.split()
+                            for i, part in enumerate(parts):
+                                if 'serial' in part.lower() and ':' in part:
+                                    serial_part = part.split(':')[-1] if ':' in part else part.split('=')[-1]
+                                    if serial_part and len(serial_part) > 3:
+                                        camera_id = serial_part.strip(':,=')
+                                        break
+                            if camera_id:
+                                break
+            except:
+                pass
+        
+        if not camera_id:
+            # Feed the hash item by item instead of building one big string.
+            # The bytes are exactly those of str(sorted(sensor_props.items()))
+            # (keys are unique, so sorting by key is the same order), which
+            # keeps IDs identical for devices that have no .camera_id yet.
+            h = hashlib.sha256(b"[")
+            for i, key in enumerate(sorted(sensor_props)):
+                if i:
+                    h.update(b", ")
+                h.update(repr((key, sensor_props[key])).encode())
+            h.update(f"]|size:{self.sensor_size[0]}x{self.sensor_size[1]}".encode())
+            camera_id = h.hexdigest()[:16]
+            print(f"Camera ID generated from properties hash: {camera_id}")
+        
+        return camera_id
+
+    def start_stream(self):
+        """Start the background thread that keeps self._latest filled."""
+        if self._stream_thread is not None and self._stream_thread.is_alive():
+            return
 
-    def take_photo(self):
+        self._stream_stop.clear()
+        self._stream_thread = threading.Thread(target=self._stream_loop, daemon=True)
+        self._stream_thread.start()
+
+    def stop_stream(self):
+        self._stream_stop.set()
+        if self._stream_thread is not None:
+            self._stream_thread.join(timeout=1)
+            self._stream_thread = None
+        self._latest = None
+
+    def _stream_loop(self):
+        seq = 0
+        while not self._stream_stop.is_set():
+            if not self.initialized or self.camera is None:
+                time.sleep(0.05)
+                continue
+
+            try:
+                # Blocks until the next frame; the UI thread never waits on this
+                frame = self.camera.capture_array("lores")
+                slot = seq % len(self._frame_bufs)
+                # OpenCV's I420 converter is NEON-vectorised and already split
+                # across cores with parallel_for_, so this stays on cv2.
+                # cv2 writes into dst when the shape matches; keep whatever it
+                # returns so a padded stride only costs one reallocation.
+                # Rotation is left to the GPU (see PREVIEW_TEX_COORDS).
+                rgb = cv2.cvtColor(frame, cv2.COLOR_YUV2RGB_I420, dst=self._frame_bufs[slot])
+                self._frame_bufs[slot] = rgb
+                seq += 1
+                self._latest = (seq, rgb)
+            except Exception:
+                time.sleep(0.05)
+
+    def get_frame(self):
+        """Return (sequence, frame) for the newest preview frame, or None."""
+        # Plain reference read; the capture thread swaps in a new tuple per frame
+        return self._latest
+
+    def take_photo(self, on_saved=None):
+        """
+        Capture a still and hand it to the photo writer thread.
+
+        Returns the target filename straight away, or None if the capture
+        failed or the writer queue is full. on_saved(filename, jpeg_bytes,
+        sha256_digest) is scheduled on the Kivy thread once the JPEG is on
+        disk, so callers can sign/upload the encoded bytes without reading
+        the file back or hashing it again (filename is None if saving failed).
+        """
         if not self.initialized:
             return None
 
@@ -293,45 +584,97 @@ class CameraController:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = CAPTURE_DIR / f"photo_{timestamp}.jpg"
 
+            if self._photo_queue.full():
+                print("Photo writer busy, dropping capture")
+                return None
+
+            # Copy the still out and hand the buffer straight back, so queued
+            # photos never pin camera buffers while they wait to be encoded
             request = self.camera.capture_request()
-            
-            if CAMERA_ROTATION != 0:
+            try:
+                # "RGB888" is already B,G,R in memory, which is what cv2 expects.
+                # While recording, main is the I420 video stream instead; the
+                # writer converts it, so stills keep working mid-recording.
                 array = request.make_array("main")
-                if CAMERA_ROTATION == 90:
-                    k = 3
-                elif CAMERA_ROTATION == 180:
-                    k = 2
-                elif CAMERA_ROTATION == 270:
-                    k = 1
-                else:
-                    k = 0
-                if k > 0:
-                    array = np.rot90(array, k=k)
-                    cv2.imwrite(str(filename), cv2.cvtColor(array, cv2.COLOR_RGB2BGR))
-                else:
-                    request.save("main", str(filename))
-            else:
-                request.save("main", str(filename))
-            
-            request.release()
+            finally:
+                request.release()
+            self._photo_queue.put_nowait((array, self.recording, str(filename), on_saved))
 
-            print(f"Photo saved: {filename}")
             return str(filename)
 
         except Exception as e:
             print(f"Error taking photo: {e}")
             return None
 
+    def photo_writer_busy(self):
+        return self._photo_queue.full()
+
+    def _photo_writer_loop(self):
+        while True:
+            array, yuv, path, on_saved = self._photo_queue.get()
+            saved = None
+            jpeg = None
+            digest = None
+            try:
+                if yuv:
+                    array = cv2.cvtColor(array, cv2.COLOR_YUV2BGR_I420)
+                # 180 is already applied by the ISP transform; only 90/270 need the CPU
+                if SOFTWARE_ROTATION in ROTATE_CODES:
+                    array = cv2.rotate(array, ROTATE_CODES[SOFTWARE_ROTATION])
+                ok, buf = cv2.imencode('.jpg', array, [cv2.IMWRITE_JPEG_QUALITY, 90])
+                if not ok:
+                    raise RuntimeError("JPEG encoding failed")
+
+                jpeg = buf.tobytes()
+                # Hash while the bytes are still hot in cache, alongside the write
+                digest = hashlib.sha256(jpeg).digest()
+                with open(path, 'wb') as f:
+                    f.write(jpeg)
+                saved = path
+                print(f"Photo saved: {path}")
+            except Exception as e:
+                print(f"Error saving photo: {e}")
+
+            if on_saved:
+                Clock.schedule_once(lambda dt, f=saved, b=jpeg, h=digest: on_saved(f, b, h), 0)
+
+            # Sign/upload is already on its way; the decoded array is still
+            # in hand, so the viewer copy and gallery thumbnail cost a resize
+            # + small encode each rather than decoding the full JPEG later
+            if saved:
+                try:
+                    if max(array.shape[:2]) > VIEW_SIZE:
+                        array = _write_scaled_jpeg(array, _view_path(saved), VIEW_SIZE, 85)
+                    _write_thumbnail(array, _thumbnail_path(saved))
+                except Exception as e:
+                    print(f"Warning: Could not write thumbnail: {e}")
+            self._photo_queue.task_done()
+
     def start_recording(self):
         if not self.initialized or self.recording:
             return None
 
+        # take_photo() releases its requests before queueing, so the only
+        # other buffer user is the capture thread; park it while the camera
+        # is reconfigured
+        was_streaming = self._stream_thread is not None
+        self.stop_stream()
         try:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = CAPTURE_DIR / f"video_{timestamp}.h264"
 
-            self.encoder = H264Encoder(bitrate=int(os.getenv('VIDEO_BITRATE', '10000000')))
+            self.camera.stop()
+            self.camera.configure(self._recording_configuration())
+
+            # H264Encoder is the V4L2 hardware encoder; repeat SPS/PPS so the
+            # raw .h264 file stays seekable without a container
+            self.encoder = H264Encoder(
+                bitrate=int(os.getenv('VIDEO_BITRATE', '10000000')),
+                repeat=True,
+                iperiod=30
+            )
             self.camera.start_recording(self.encoder, str(filename))
+            self._apply_zoom()
 
             self.recording = True
             print(f"Recording started: {filename}")
@@ -339,31 +682,49 @@ class CameraController:
 
         except Exception as e:
             print(f"Error starting recording: {e}")
+            try:
+                self.camera.stop()
+                self.camera.configure(self._photo_configuration())
+                self.camera.start()
+            except Exception:
+                pass
             return None
 
+        finally:
+            if was_streaming:
+                self.start_stream()
+
     def stop_recording(self):
         if not self.recording:
             return
 
+        was_streaming = self._stream_thread is not None
+        self.stop_stream()
         try:
             self.camera.stop_recording()
             self.recording = False
             print("Recording stopped")
+            self.camera.configure(self._photo_configuration())
             self.camera.start()
+            self._apply_zoom()
 
         except Exception as e:
             print(f"Error stopping recording: {e}")
             self.recording = False
 
+        finally:
+            if was_streaming:
+                self.start_stream()
+
     def zoom_in(self):
         self.current_zoom = min(MAX_ZOOM, self.current_zoom + ZOOM_STEP)
-        self._apply_zoom()
+        self._zoom_trigger()
 
     def zoom_out(self):
         self.current_zoom = max(MIN_ZOOM, self.current_zoom - ZOOM_STEP)
-        self._apply_zoom()
+        self._zoom_trigger()
 
-    def _apply_zoom(self):
+    def _apply_zoom(self, *args):
         if not self.initialized or self.sensor_size is None:
             return
 
@@ -389,6 +750,8 @@ class CameraController:
         return self.camera_id
     
     def cleanup(self):
+        self.stop_stream()
+
         if self.recording:
             self.stop_recording()
 
@@ -399,6 +762,66 @@ class CameraController:
             except:
                 pass
 
+class GalleryCell(RecycleDataViewBehavior, BoxLayout):
+    """Gallery tile; the RecycleView reuses a screenful of these for all media."""
+
+    def __init__(self, **kwargs):
+        super().__init__(orientation='vertical', spacing=8, **kwargs)
+        self.filepath = None
+        self.media_type = None
+        self._thumb = None
+
+        # Styling shared by every item is set once here; refresh_view_attrs
+        # only touches what differs between photos and videos
+        self.thumb_button = Button(
+            size_hint=(1, 0.88),
+            border=(0, 0, 0, 0),
+            # Pressed state is a plain tile, so each cell binds one image
+            # texture (the thumbnail) instead of two
+            background_down='',
+            font_size='28sp',
+            color=(1, 1, 1, 1),
+            bold=True
+        )
+        self.thumb_button.bind(on_press=self._on_press)
+
+        self.label = Label(
+            font_size='14sp',
+            size_hint=(1, 0.12),
+            color=(1, 1, 1, 1),
+            halign='center',
+            valign='middle'
+        )
+        self.label.bind(size=_sync_text_size)
+
+        self.add_widget(self.thumb_button)
+        self.add_widget(self.label)
+
+    def refresh_view_attrs(self, rv, index, data):
+        # Called whenever this widget is rebound to a different item; only
+        # the visible cells ever load an image
+        if data['filepath'] == self.filepath and data['thumb'] == self._thumb:
+            # refresh_from_data() after a thumbnail lands revisits every cell
+            return
+        self._thumb = data['thumb']
+        self.filepath = data['filepath']
+        self.media_type = data['media_type']
+        self.label.text = data['label_text']
+
+        if self.media_type == 'photo':
+            self.thumb_button.text = ''
+            # An empty thumb is a plain tile while the thumbnail is generated
+            self.thumb_button.background_color = (1, 1, 1, 1) if data['thumb'] else (0.15, 0.15, 0.15, 1)
+            self.thumb_button.background_normal = data['thumb']
+        else:
+            # Video placeholder
+            self.thumb_button.text = '▶️\nVIDEO'
+            self.thumb_button.background_color = (0.15, 0.15, 0.25, 1)
+            self.thumb_button.background_normal = ''
+
+    def _on_press(self, instance):
+        App.get_running_app().view_media(self)
+
 class CameraApp(App):
 
     def build(self):
@@ -406,13 +829,23 @@ class CameraApp(App):
 
         self.root_layout = FloatLayout()
 
-        self.preview_image = Image(
+        # A bare widget with one textured rectangle, stretched over the whole
+        # screen (no black bars). Black until the first frame arrives.
+        self.preview_image = Widget(
             size_hint=(1, 1),
-            pos_hint={'x': 0, 'y': 0},
-            allow_stretch=True,
-            keep_ratio=False  # Fill entire screen without black bars
+            pos_hint={'x': 0, 'y': 0}
+        )
+        with self.preview_image.canvas:
+            self._preview_color = Color(0, 0, 0, 1)
+            self._preview_rect = Rectangle(pos=self.preview_image.pos, size=self.preview_image.size)
+        self.preview_image.bind(
+            pos=lambda w, v: setattr(self._preview_rect, 'pos', v),
+            size=lambda w, v: setattr(self._preview_rect, 'size', v)
         )
         self.root_layout.add_widget(self.preview_image)
+        self._preview_tex = None
+        self._preview_tex_key = None
+        self._last_frame_seq = None
 
         self.top_bar = BoxLayout(
             orientation='horizontal',
@@ -430,7 +863,7 @@ class CameraApp(App):
             font_size='10sp',
             color=(1, 1, 1, 1)
         )
-        self.datetime_label.bind(size=self.datetime_label.setter('text_size'))
+        self.datetime_label.bind(size=_sync_text_size)
 
         self.battery_label = Label(
             text='Battery: ---%',
@@ -441,7 +874,22 @@ class CameraApp(App):
             color=(1, 1, 1, 1),
             bold=True
         )
-        self.battery_label.bind(size=self.battery_label.setter('text_size'))
+        self.battery_label.bind(size=_sync_text_size)
+        # Every Label.text assignment re-renders the text texture, so only
+        # assign when the displayed value actually changes
+        self._last_dt_sec = None
+        # Gallery thumbnails already verified, keyed by photo path -> photo mtime
+        self._thumb_mtimes = {}
+        # Gallery overlay and full screen viewer, built on first use by
+        # _build_gallery_overlay/_build_viewer; None until then
+        self.gallery_overlay = None
+        self.viewer_overlay = None
+        self._viewer_image = None
+        # Gallery listing, rebuilt only after captures/deletes or outside changes
+        self._gallery_cache = None
+        self._gallery_cache_mtime = None
+        self._last_battery_level = None
+        self._last_battery_color = None
 
         self.fund_button = Button(
             text='💰',
@@ -591,7 +1039,7 @@ class CameraApp(App):
             size_hint=(1, 0.1),
             halign='center'
         )
-        self.qr_status.bind(size=self.qr_status.setter('text_size'))
+        self.qr_status.bind(size=_sync_text_size)
         
         qr_close = Button(
             text='Close',
@@ -613,12 +1061,44 @@ class CameraApp(App):
         
         self.active_claims = {}
         self.cleared_mint_status = set()
+        self._claim_poll_event = None
+
+        # Shared keep-alive session for registration, uploads and claim checks,
+        # so each call reuses a pooled connection instead of a new handshake.
+        # urllib3 only retries POSTs on connection errors, not on status.
+        self.http = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=urllib3.Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        )
+        self.http.mount('http://', adapter)
+        self.http.mount('https://', adapter)
+
+        # Persistent workers for sign + upload and the one-shot balance and
+        # registration requests; two is enough to overlap one upload with the
+        # next signature without saturating the uplink
+        self._io_pool = concurrent.futures.ThreadPoolExecutor(max_workers=2, thread_name_prefix='capture-io')
+        self._io_pending = 0
+        # Backfills gallery thumbnails for older captures without blocking
+        # the UI; the whole sweep is queued at once and fanned out over
+        # THUMB_WORKERS, newest (top of the grid) first
+        self._thumb_pool = concurrent.futures.ThreadPoolExecutor(max_workers=THUMB_WORKERS, thread_name_prefix='thumbs')
+        self._thumb_pending = set()
+        self._gallery_refresh_trigger = Clock.create_trigger(self._refresh_gallery_view)
+        # Finish deletes interrupted by a previous shutdown
+        self._thumb_pool.submit(_empty_trash)
 
         self.camera = CameraController()
         self.battery_monitor = BatteryMonitor()
         
         self.hardware_identity = None
         camera_id = None
+        # Identity is fixed for the run; resolved once below and reused by
+        # registration, upload, export and the startup printout
+        self._hw_info = None
+        self._camera_id = None
+        self._device_id = None
         
         self.camera_ready = False
         self.balance_check_passed = False
@@ -627,6 +1107,7 @@ class CameraApp(App):
             try:
                 if self.camera.initialize():
                     camera_id = self.camera.get_camera_id()
+                    self._camera_id = camera_id
                 else:
                     self.status_label.text = '✗ Camera Error'
                     self.show_error("Camera initialization failed")
@@ -645,6 +1126,9 @@ class CameraApp(App):
         if HARDWARE_IDENTITY_AVAILABLE:
             try:
                 self.hardware_identity = get_hardware_identity(camera_id=camera_id)
+                self._hw_info = self.hardware_identity.get_hardware_info()
+                if self._camera_id:
+                    self._device_id = f"{self._hw_info['address'][:8]}_{self._camera_id[:8]}"
                 
                 # Automatically export key for backend to use
                 self._export_device_key()
@@ -654,10 +1138,30 @@ class CameraApp(App):
             except Exception as e:
                 print(f"Warning: Could not initialize hardware identity: {e}")
                 self.hardware_identity = None
+                self._hw_info = None
+                self._device_id = None
+        
+        # Pushed balance/claim updates; the pollers below only hit the
+        # backend while this stream is down
+        self._events_connected = False
+        # Bumped on every stream (re)connect; claims the backend has
+        # acknowledged watching on the current connection
+        self._events_generation = 0
+        self._watched_claims = set()
+        self._awaiting_balance = False
+        self._online = True
+        self._online_checked_at = 0
+        # Set once the backend confirms the device is registered and active;
+        # until then uploads carry the registration details with them
+        self._registered_ack = False
+        # Set while the ensure-registered call is out, so uploads don't start
+        # a second registration for the same address alongside it
+        self._registration_pending = False
+        self._start_event_stream()
         
         # Check balance and show funding QR if needed
         if self.hardware_identity:
-            Clock.schedule_once(lambda dt: self._check_balance_and_setup(), 1)
+            Clock.schedule_once(self._check_balance_and_setup, 1)
         
         # Schedule UI updates
         Clock.schedule_interval(self.update_datetime, 1.0)
@@ -665,18 +1169,19 @@ class CameraApp(App):
 
         return self.root_layout
     
-    def _check_balance_and_setup(self):
+    def _check_balance_and_setup(self, *args):
         """Check wallet balance and setup camera stream if sufficient."""
         def check_thread():
             try:
                 # Check balance via backend
-                response = requests.get(
+                response = POOL.request(
+                    'GET',
                     f'{BACKEND_URL}/api/balance',
                     timeout=10
                 )
                 
-                if response.status_code == 200:
-                    result = response.json()
+                if response.status == 200:
+                    result = _json_loads(response.data)
                     if result.get('success'):
                         address = result.get('address')
                         eth_data = result.get('eth', {})
@@ -695,7 +1200,7 @@ class CameraApp(App):
                         
                         # Always start camera stream - show QR overlay if balance is low
                         Clock.schedule_once(
-                            lambda dt: self._start_camera_stream(),
+                            self._start_camera_stream,
                             0
                         )
                         
@@ -703,7 +1208,7 @@ class CameraApp(App):
                         if has_enough_eth:
                             # ETH balance sufficient - register device
                             Clock.schedule_once(
-                                lambda dt: self._try_register_device(),
+                                self._try_register_device,
                                 1
                             )
                             self.balance_check_passed = True
@@ -733,41 +1238,70 @@ class CameraApp(App):
                         # Balance check failed - try to start anyway
                         print(f"⚠️ Balance check failed, starting camera anyway")
                         Clock.schedule_once(
-                            lambda dt: self._start_camera_stream(),
+                            self._start_camera_stream,
                             0
                         )
                 else:
                     # Backend not available - start camera anyway
                     print(f"⚠️ Backend not available, starting camera anyway")
                     Clock.schedule_once(
-                        lambda dt: self._start_camera_stream(),
+                        self._start_camera_stream,
                         0
                     )
             except Exception as e:
                 print(f"⚠️ Error checking balance: {e}")
                 # Start camera anyway if check fails
                 Clock.schedule_once(
-                    lambda dt: self._start_camera_stream(),
+                    self._start_camera_stream,
                     0
                 )
         
-        threading.Thread(target=check_thread, daemon=True).start()
+        self._io_pool.submit(check_thread)
     
-    def _start_camera_stream(self):
+    def _start_camera_stream(self, *args):
         """Start camera preview stream."""
         if CAMERA_AVAILABLE and self.camera.initialized:
             self.status_label.text = '✓ Ready'
+            self.camera.start_stream()
             # Schedule preview updates
             Clock.schedule_interval(self.update_preview, 1.0 / 30.0)  # 30 FPS
             # Clear status after 2 seconds
-            Clock.schedule_once(lambda dt: setattr(self.status_label, 'text', ''), 2)
+            Clock.schedule_once(self._clear_status, 2)
             self.camera_ready = True
     
     def _show_funding_qr_button(self, instance):
         if self.hardware_identity:
-            hw_info = self.hardware_identity.get_hardware_info()
-            address = hw_info['address']
-            self._show_funding_qr(address, 0, 'ETH')
+            self._show_funding_qr(self._hw_info['address'], 0, 'ETH')
+    
+    def _qr_png(self, data):
+        """
+        Return the path of a QR code PNG for data, rendering it only once.
+
+        The image depends only on the encoded data, so it is cached on disk
+        under a hash of it and reused on every later poll/press.
+        """
+        key = hashlib.sha256(data.encode()).hexdigest()[:12]
+        qr_path = CAPTURE_DIR / f"qr_{key}.png"
+        
+        if not qr_path.exists():
+            qr = qrcode.QRCode(
+                version=1,
+                error_correction=qrcode.constants.ERROR_CORRECT_L,
+                box_size=10,
+                border=4,
+            )
+            qr.add_data(data)
+            qr.make(fit=True)
+            
+            img = qr.make_image(fill_color="black", back_color="white")
+            
+            # Write beside the final name and rename, so a crash never
+            # leaves a truncated PNG that would be reused forever
+            tmp_path = qr_path.with_suffix('.tmp')
+            img.save(str(tmp_path), format='PNG')
+            os.replace(tmp_path, qr_path)
+        
+        return qr_path
     
     def _show_funding_qr(self, address, current_balance, token_type='ETH'):
         """Show QR code for funding the wallet."""
@@ -782,32 +1316,9 @@ class CameraApp(App):
             # Use plain address - MetaMask can scan it directly
             funding_data = address
             
-            # Generate QR code
-            qr = qrcode.QRCode(
-                version=1,
-                error_correction=qrcode.constants.ERROR_CORRECT_L,
-                box_size=10,
-                border=4,
-            )
-            qr.add_data(funding_data)
-            qr.make(fit=True)
-            
-            # Create image
-            img = qr.make_image(fill_color="black", back_color="white")
-            
-            # Convert to bytes
-            img_bytes = BytesIO()
-            img.save(img_bytes, format='PNG')
-            img_bytes.seek(0)
-            
-            # Save to temp file
-            temp_path = Path(CAPTURE_DIR) / "funding_qr.png"
-            with open(temp_path, 'wb') as f:
-                f.write(img_bytes.read())
-            
-            # Update QR overlay for funding
-            self.qr_image.source = str(temp_path)
-            self.qr_image.reload()
+            # Update QR overlay for funding. The file for a given key never
+            # changes, so Kivy's image cache can serve it without a reload()
+            self.qr_image.source = str(self._qr_png(funding_data))
             
             # Update title and status text
             self.qr_title.text = '💰 Fund Wallet'
@@ -826,62 +1337,153 @@ class CameraApp(App):
             print(f"Error generating funding QR: {e}")
             self.status_label.text = f'⚠️ Fund: {address}'
     
+    def _start_event_stream(self):
+        """Listen on the backend's event stream and dispatch updates to the UI."""
+        def stream_thread():
+            backoff = 1
+            while True:
+                try:
+                    with self.http.get(
+                        f'{BACKEND_URL}/api/events',
+                        stream=True,
+                        timeout=(5, 60)  # server sends a heartbeat every 25s
+                    ) as response:
+                        response.raise_for_status()
+                        self._events_connected = True
+                        self._events_generation += 1
+                        Clock.schedule_once(partial(self._on_events_connected, self._events_generation), 0)
+                        backoff = 1
+                        
+                        event_type = None
+                        for line in response.iter_lines(decode_unicode=True):
+                            if line.startswith('event:'):
+                                event_type = line[6:].strip()
+                            elif line.startswith('data:') and event_type:
+                                self._dispatch_event(event_type, json.loads(line[5:]))
+                            elif not line:
+                                event_type = None
+                except Exception as e:
+                    print(f"Event stream disconnected: {e}")
+                finally:
+                    self._events_connected = False
+                
+                time.sleep(backoff)
+                backoff = min(backoff * 2, 30)
+        
+        threading.Thread(target=stream_thread, daemon=True).start()
+    
+    def _on_events_connected(self, generation, *args):
+        # A fresh connection may be to a restarted backend that knows none of
+        # our claims; poll them until it confirms it is watching them again
+        self._watched_claims = set()
+        self._subscribe_claims(list(self.active_claims), generation)
+
+    def _subscribe_claims(self, claim_ids, generation):
+        """Ask the backend to push updates for these claims on the event stream."""
+        if not claim_ids:
+            return
+
+        def subscribe():
+            try:
+                response = self.http.post(
+                    f'{BACKEND_URL}/api/events/watch',
+                    json={'claim_ids': claim_ids},
+                    timeout=5
+                )
+                if response.status_code == 200:
+                    result = response.json()
+                    if result.get('success'):
+                        watching = set(result.get('watching', []))
+                        Clock.schedule_once(partial(self._on_claims_watched, generation, watching), 0)
+            except Exception as e:
+                print(f"Could not subscribe to claim updates: {e}")
+
+        self._io_pool.submit(subscribe)
+
+    def _on_claims_watched(self, generation, claim_ids, *args):
+        # Ignore acks from a connection that has since dropped
+        if generation == self._events_generation:
+            self._watched_claims.update(claim_ids)
+
+    def _dispatch_event(self, event_type, payload):
+        if event_type == 'balance':
+            Clock.schedule_once(
+                lambda dt: self._on_balance_update(payload.get('balanceEth', 0), payload.get('ready', False)),
+                0
+            )
+        elif event_type == 'claim_update':
+            claim_id = payload.get('claim_id')
+            if claim_id in self.active_claims:
+                Clock.schedule_once(lambda dt: self._apply_claim_status(claim_id, payload), 0)
+        elif event_type == 'registration':
+            # Outcome of the background registration an upload kicked off
+            address = (payload.get('deviceAddress') or '').lower()
+            if (self._hw_info and address == self._hw_info['address'].lower()
+                    and payload.get('registered') and payload.get('activated')):
+                Clock.schedule_once(lambda dt: setattr(self, '_registered_ack', True), 0)
+    
+    def _on_balance_update(self, balance_eth, has_enough_eth):
+        """Apply a balance reading while waiting for funds. Returns True once funded."""
+        if self.balance_check_passed or not self._awaiting_balance:
+            return True
+        
+        # Update status
+        self.qr_status.text = f'Current Balance: {balance_eth:.4f} ETH\n\nWaiting for 0.01+ ETH...'
+        
+        if not has_enough_eth:
+            return False
+        
+        # ETH balance is now sufficient - register device!
+        print(f"✅ ETH balance sufficient: {balance_eth} ETH")
+        self.balance_check_passed = True
+        self._awaiting_balance = False
+        
+        # Already on the Kivy thread, so apply the ready state in one pass
+        self._apply_ready_state()
+        
+        # Register device (only depends on ETH balance for gas fees)
+        if self.hardware_identity and self.camera.initialized:
+            Clock.schedule_once(
+                self._try_register_device,
+                1
+            )
+        
+        return True
+    
+    def _apply_ready_state(self, dt=None):
+        """Hide the funding overlay, start the preview and show the ready status."""
+        self.qr_overlay.opacity = 0
+        self._start_camera_stream()
+        self.status_label.text = '✓ Ready'
+        self.status_label.color = (0, 1, 0, 1)
+    
     def _start_balance_polling(self, address):
         """Poll balance until sufficient funds are available."""
+        self._awaiting_balance = True
+        
         def poll_balance(dt):
             if self.balance_check_passed:
                 return False  # Stop polling
             
+            # The event stream pushes balance changes while it is connected
+            if self._events_connected:
+                return True
+            
             try:
-                response = requests.get(
+                response = POOL.request(
+                    'GET',
                     f'{BACKEND_URL}/api/balance',
                     timeout=5
                 )
                 
-                if response.status_code == 200:
-                    result = response.json()
+                if response.status == 200:
+                    result = _json_loads(response.data)
                     if result.get('success'):
                         eth_data = result.get('eth', {})
                         balance_eth = eth_data.get('balanceEth', 0)
                         has_enough_eth = eth_data.get('hasEnoughBalance', False)
                         
-                        # Update status
-                        self.qr_status.text = f'Current Balance: {balance_eth:.4f} ETH\n\nWaiting for 0.01+ ETH...'
-                        
-                        if has_enough_eth:
-                            # ETH balance is now sufficient - register device!
-                            print(f"✅ ETH balance sufficient: {balance_eth} ETH")
-                            self.balance_check_passed = True
-                            
-                            # Hide QR overlay
-                            Clock.schedule_once(
-                                lambda dt: setattr(self.qr_overlay, 'opacity', 0),
-                                0
-                            )
-                            
-                            # Start camera stream
-                            Clock.schedule_once(
-                                lambda dt: self._start_camera_stream(),
-                                0
-                            )
-                            
-                            # Register device (only depends on ETH balance for gas fees)
-                            if self.hardware_identity and self.camera.initialized:
-                                Clock.schedule_once(
-                                    lambda dt: self._try_register_device(),
-                                    1
-                                )
-                            
-                            # Update status
-                            Clock.schedule_once(
-                                lambda dt: setattr(self.status_label, 'text', '✓ Ready'),
-                                0
-                            )
-                            Clock.schedule_once(
-                                lambda dt: setattr(self.status_label, 'color', (0, 1, 0, 1)),
-                                0
-                            )
-                            
+                        if self._on_balance_update(balance_eth, has_enough_eth):
                             return False  # Stop polling
                             
             except Exception as e:
@@ -892,7 +1494,7 @@ class CameraApp(App):
         # Poll every 10 seconds
         Clock.schedule_interval(poll_balance, 10)
     
-    def _try_register_device(self):
+    def _try_register_device(self, *args):
         """Ensure device is registered and active with backend."""
         print("\n📋 [KIVY] Device registration check starting...")
         
@@ -907,15 +1509,16 @@ class CameraApp(App):
         print("   ✅ Hardware identity and camera ready")
         
         def register_thread():
+            # A cold-start upload may already have registered us
+            if self._registered_ack:
+                print("✅ Device already registered and active")
+                self._registration_pending = False
+                return
             try:
-                print("   🔄 Getting hardware info...")
-                hw_info = self.hardware_identity.get_hardware_info()
-                device_address = hw_info['address']
-                public_key = hw_info['public_key_hex']
-                camera_id = self.camera.get_camera_id()
-                
-                # Generate device ID from hardware info
-                device_id = f"{device_address[:8]}_{camera_id[:8]}"
+                device_address = self._hw_info['address']
+                public_key = self._hw_info['public_key_hex']
+                camera_id = self._camera_id
+                device_id = self._device_id
                 
                 print(f"   📊 Device details:")
                 print(f"      Address: {device_address}")
@@ -926,7 +1529,7 @@ class CameraApp(App):
                 # 1. Check if registered - if not, register
                 # 2. Check if active - if not, activate
                 print(f"   🔄 Calling {BACKEND_URL}/api/device/ensure-registered...")
-                response = requests.post(
+                response = self.http.post(
                     f'{BACKEND_URL}/api/device/ensure-registered',
                     json={
                         'deviceAddress': device_address,
@@ -947,6 +1550,7 @@ class CameraApp(App):
                     
                     if result.get('success'):
                         if result.get('registered') and result.get('activated'):
+                            self._registered_ack = True
                             if result.get('registrationTx'):
                                 print(f"✅ Device registered: {result.get('registrationTx')}")
                             if result.get('activationTx'):
@@ -971,12 +1575,20 @@ class CameraApp(App):
                 print(f"❌ Could not register device: {e}")
                 import traceback
                 print(f"   Traceback: {traceback.format_exc()}")
+            finally:
+                self._registration_pending = False
         
-        threading.Thread(target=register_thread, daemon=True).start()
+        self._registration_pending = True
+        self._io_pool.submit(register_thread)
 
     def update_preview(self, dt):
-        """Update camera preview frame with rotation support."""
-        frame = self.camera.get_frame()
+        """Upload the newest preview frame; rotation is applied on the GPU."""
+        latest = self.camera.get_frame()
+
+        # Nothing new from the capture thread since the last tick
+        if latest is None or latest[0] == self._last_frame_seq:
+            return
+        self._last_frame_seq, frame = latest
 
         if frame is not None:
             try:
@@ -987,34 +1599,6 @@ class CameraApp(App):
                     height, width = frame.shape
                     channels = 1
 
-                # Apply rotation if configured
-                if CAMERA_ROTATION != 0:
-                    # Calculate number of 90-degree rotations (k parameter for np.rot90)
-                    # rot90 rotates counter-clockwise, so we need to adjust
-                    # 90° clockwise = 270° counter-clockwise = k=3
-                    # 180° = k=2
-                    # 270° clockwise = 90° counter-clockwise = k=1
-                    if CAMERA_ROTATION == 90:
-                        k = 3  # 90° clockwise = 270° counter-clockwise
-                    elif CAMERA_ROTATION == 180:
-                        k = 2
-                    elif CAMERA_ROTATION == 270:
-                        k = 1  # 270° clockwise = 90° counter-clockwise
-                    else:
-                        k = 0
-                    
-                    if k > 0:
-                        frame = np.rot90(frame, k=k)
-                        # Swap width and height after 90/270 degree rotation
-                        if CAMERA_ROTATION in [90, 270]:
-                            width, height = height, width
-
-                # Flip vertically for Kivy (if needed)
-                frame = frame[::-1, :, :]
-
-                # Convert to bytes
-                buf = frame.tobytes()
-
                 # Determine color format based on channels
                 if channels == 3:
                     colorfmt = 'rgb'
@@ -1023,31 +1607,40 @@ class CameraApp(App):
                 else:
                     colorfmt = 'luminance'
 
-                # Create texture with correct dimensions after rotation
-                texture = Texture.create(size=(width, height), colorfmt=colorfmt)
-                texture.blit_buffer(buf, colorfmt=colorfmt, bufferfmt='ubyte')
-
-                self.preview_image.texture = texture
+                # Only (re)create the texture when the frame geometry changes,
+                # which in practice means once; every other frame just re-uploads
+                # pixels. Rotation and row order are handled by the rectangle's
+                # texture coordinates, so the numpy buffer is uploaded as-is.
+                key = (width, height, colorfmt)
+                if key != self._preview_tex_key:
+                    self._preview_tex = Texture.create(size=(width, height), colorfmt=colorfmt)
+                    self._preview_tex_key = key
+                    self._preview_rect.texture = self._preview_tex
+                    # Assigning a texture resets tex_coords, so set them after
+                    self._preview_rect.tex_coords = PREVIEW_TEX_COORDS.get(SOFTWARE_ROTATION, PREVIEW_TEX_COORDS[0])
+                    self._preview_color.rgba = (1, 1, 1, 1)
+                self._preview_tex.blit_buffer(memoryview(frame).cast('B'), colorfmt=colorfmt, bufferfmt='ubyte')
+                self.preview_image.canvas.ask_update()
             except Exception as e:
                 print(f"Preview error: {e}")
 
     def update_datetime(self, dt):
         """Update date/time display."""
-        now = datetime.now()
-        self.datetime_label.text = now.strftime("%Y-%m-%d %H:%M:%S")
+        # Integer compare first so sub-second ticks don't even format
+        t = int(time.time())
+        if t == self._last_dt_sec:
+            return
+        self._last_dt_sec = t
+        self.datetime_label.text = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(t))
 
     def _export_device_key(self):
         """Export device key to file for backend to use."""
         try:
-            import json
-            from pathlib import Path
-            
             if not self.hardware_identity:
                 return
             
-            # Get hardware info
-            hw_info = self.hardware_identity.get_hardware_info()
-            private_key_hex = self.hardware_identity.private_key.to_string().hex()
+            hw_info = self._hw_info
+            private_key_hex = self.hardware_identity.get_private_key_hex()
             
             # Export data
             export_data = {
@@ -1075,7 +1668,7 @@ class CameraApp(App):
         print("=" * 60)
         
         if self.hardware_identity:
-            hw_info = self.hardware_identity.get_hardware_info()
+            hw_info = self._hw_info
             print(f"✓ Public Address: {hw_info['address']}")
             print(f"✓ Camera ID: {hw_info['camera_id'] or 'Not available'}")
             print(f"✓ Public Key: {hw_info['public_key_hex'][:32]}...{hw_info['public_key_hex'][-8:]}")
@@ -1085,7 +1678,7 @@ class CameraApp(App):
             print("✗ Hardware identity not available")
         
         if self.camera and self.camera.initialized:
-            print(f"✓ Camera ID: {self.camera.get_camera_id()}")
+            print(f"✓ Camera ID: {self._camera_id}")
             print(f"✓ Camera Initialized: {self.camera.initialized}")
         else:
             print("✗ Camera not initialized")
@@ -1095,136 +1688,176 @@ class CameraApp(App):
     def update_battery(self, dt):
         """Update battery level display."""
         level = self.battery_monitor.get_battery_level()
+        if level == self._last_battery_level:
+            return
+        self._last_battery_level = level
         self.battery_label.text = f'Battery: {level}%'
 
-        # Change color based on battery level
+        # Change color based on battery level, only when crossing a threshold
         if level < 20:
-            self.battery_label.color = (1, 0, 0, 1)  # Red
+            color = (1, 0, 0, 1)  # Red
         elif level < 50:
-            self.battery_label.color = (1, 1, 0, 1)  # Yellow
+            color = (1, 1, 0, 1)  # Yellow
         else:
-            self.battery_label.color = (0, 1, 0, 1)  # Green
+            color = (0, 1, 0, 1)  # Green
+        if color != self._last_battery_color:
+            self._last_battery_color = color
+            self.battery_label.color = color
 
     def take_photo(self, instance):
         """Handle photo capture button press."""
+        if self.camera.photo_writer_busy() or self._io_pending >= MAX_PENDING_UPLOADS:
+            self._flash_status('⏳ Busy')
+            return
+
         self.status_label.text = '📸 Capturing...'
 
-        # Run in thread to avoid blocking UI
-        def capture_thread():
-            filename = self.camera.take_photo()
+        # Only the capture and buffer copy happen here; encoding runs on the writer thread
+        if not self.camera.take_photo(on_saved=self._on_photo_saved):
+            self._flash_status('✗ Failed')
 
-            if filename:
+    def _flash_status(self, text, duration=2, *args):
+        self.status_label.text = text
+        Clock.schedule_once(self._clear_status, duration)
+
+    # Clock callbacks for status text; scheduled directly (or via partial)
+    # so no closure is allocated per event.
+    def _set_status(self, text, *args):
+        self.status_label.text = text
+
+    def _clear_status(self, *args):
+        self.status_label.text = ''
+
+    def _on_photo_saved(self, filename, image_data, image_hash=None):
+        """Called on the Kivy thread once the writer thread has saved a photo."""
+        if not filename:
+            self._flash_status('✗ Failed')
+            return
+        self._invalidate_gallery()
+
+        # _io_pending is only touched on the Kivy thread
+        self._io_pending += 1
+        future = self._io_pool.submit(self._process_photo, filename, image_data, image_hash)
+        future.add_done_callback(lambda f: Clock.schedule_once(self._on_photo_processed, 0))
+
+    def _on_photo_processed(self, dt):
+        self._io_pending -= 1
+
+    def _process_photo(self, filename, image_data=None, image_hash=None):
+        """Sign and upload a saved photo (runs off the Kivy thread)."""
+        try:
+            # Generate hardware signature for the image
+            signature_info = None
+            if self.hardware_identity:
                 try:
-                    # Generate hardware signature for the image
-                    signature_info = None
-                    if self.hardware_identity:
-                        try:
-                            signature_info = self._sign_image(filename)
-                            if signature_info:
-                                print(f"Image signed: {signature_info['address']}")
-                        except Exception as e:
-                            print(f"Warning: Could not sign image: {e}")
-                    
+                    signature_info = self._sign_image(filename, image_data, image_hash)
                     if signature_info:
-                        # Upload to backend and create claim
-                        self._upload_and_create_claim(filename, signature_info)
-                    else:
-                        Clock.schedule_once(
-                            lambda dt: setattr(self.status_label, 'text', '✗ Sign Failed'),
-                            0
-                        )
-                        Clock.schedule_once(
-                            lambda dt: setattr(self.status_label, 'text', ''),
-                            2
-                        )
+                        print(f"Image signed: {signature_info['address']}")
                 except Exception as e:
-                    print(f"Error processing photo: {e}")
-                    Clock.schedule_once(
-                        lambda dt: setattr(self.status_label, 'text', '✗ Error'),
-                        0
-                    )
-                    Clock.schedule_once(
-                        lambda dt: setattr(self.status_label, 'text', ''),
-                        2
-                    )
-            else:
-                Clock.schedule_once(
-                    lambda dt: setattr(self.status_label, 'text', '✗ Failed'),
-                    0
-                )
-                Clock.schedule_once(
-                    lambda dt: setattr(self.status_label, 'text', ''),
-                    2
-                )
+                    print(f"Warning: Could not sign image: {e}")
 
-        threading.Thread(target=capture_thread, daemon=True).start()
+            if signature_info:
+                # Upload to backend and create claim
+                self._upload_and_create_claim(filename, signature_info, image_data)
+            else:
+                Clock.schedule_once(partial(self._flash_status, '✗ Sign Failed', 2), 0)
+        except Exception as e:
+            print(f"Error processing photo: {e}")
+            Clock.schedule_once(partial(self._flash_status, '✗ Error', 2), 0)
+    
+    def _mark_online(self):
+        self._online = True
+        self._online_checked_at = time.monotonic()
     
-    def _upload_and_create_claim(self, filename, signature_info):
+    def _backend_online(self):
+        """
+        Cheap, cached reachability check for the backend.
+        
+        A live event stream or a successful request in the last few seconds
+        counts as proof; otherwise a bare TCP connect stands in for the old
+        /health round-trips, and its result is cached for 5 seconds.
+        """
+        if self._events_connected:
+            return True
+        
+        if time.monotonic() - self._online_checked_at < 5:
+            return self._online
+        
+        url = urlparse(BACKEND_URL)
+        port = url.port or (443 if url.scheme == 'https' else 80)
+        try:
+            socket.create_connection((url.hostname, port), timeout=1).close()
+            self._mark_online()
+        except OSError:
+            self._online = False
+            self._online_checked_at = time.monotonic()
+        
+        return self._online
+    
+    def _upload_and_create_claim(self, filename, signature_info, image_data=None):
         """Upload image to backend and create claim."""
         # Check if offline - save to queue
-        try:
-            # Try to ping backend first with retry
-            online = False
-            for attempt in range(3):
-                try:
-                    requests.get(f'{BACKEND_URL}/health', timeout=2)
-                    online = True
-                    break
-                except:
-                    if attempt < 2:
-                        time.sleep(1)
-                    else:
-                        online = False
-        except:
-            online = False
+        if not self._backend_online():
             print("⚠️ Backend offline - saving to queue")
-            Clock.schedule_once(
-                lambda dt: setattr(self.status_label, 'text', '⚠️ Offline - Saved Locally'),
-                0
-            )
-            Clock.schedule_once(
-                lambda dt: setattr(self.status_label, 'text', ''),
-                3
-            )
+            Clock.schedule_once(partial(self._flash_status, '⚠️ Offline - Saved Locally', 3), 0)
             return
         
         try:
             Clock.schedule_once(
-                lambda dt: setattr(self.status_label, 'text', '📤 Uploading...'),
+                partial(self._set_status, '📤 Uploading...'),
                 0
             )
             
-            # Read image file
-            with open(filename, 'rb') as f:
-                image_data = f.read()
-            
-            # Compute image hash
-            image_hash = hashlib.sha256(image_data).hexdigest()
+            # _sign_image already hashed these exact bytes
+            image_hash = signature_info['image_hash']
             
             # Get device info
             device_address = signature_info['address']
-            camera_id = self.camera.get_camera_id() if self.camera.initialized else 'unknown'
+            camera_id = self._camera_id or 'unknown'
             
             # Prepare multipart form data
-            files = {'image': (os.path.basename(filename), image_data, 'image/jpeg')}
             data = {
                 'imageHash': image_hash,
                 'signature': signature_info['signature'],
                 'cameraId': camera_id,
                 'deviceAddress': device_address
             }
+            if not (self._registered_ack or self._registration_pending) and self._device_id:
+                # Let the backend ensure registration in the same request
+                # rather than waiting on a separate ensure-registered call
+                data['register_if_needed'] = json.dumps({
+                    'publicKey': self._hw_info['public_key_hex'],
+                    'deviceId': self._device_id,
+                    'model': 'Raspberry Pi',
+                    'firmwareVersion': '1.0.0'
+                })
+            boundary = os.urandom(16).hex()
             
-            # Upload to backend
-            response = requests.post(
-                f'{BACKEND_URL}/api/images/upload',
-                files=files,
-                data=data,
-                timeout=60
-            )
+            # Upload to backend. requests' files= would assemble the whole
+            # multipart body in memory, so stream it instead: straight from
+            # the photo writer's bytes when we have them, else off the disk.
+            with (open(filename, 'rb') if image_data is None
+                  else contextlib.nullcontext(image_data)) as body:
+                response = self.http.post(
+                    f'{BACKEND_URL}/api/images/upload',
+                    data=_iter_multipart(
+                        boundary, data, 'image',
+                        os.path.basename(filename), 'image/jpeg', body
+                    ),
+                    headers={'Content-Type': f'multipart/form-data; boundary={boundary}'},
+                    timeout=60
+                )
             
             if response.status_code == 200:
+                self._mark_online()
                 result = response.json()
                 
+                # Usually just {pending: true}; the outcome arrives as a
+                # 'registration' event, or with a later upload's response
+                registration = result.get('registration')
+                if registration and registration.get('registered') and registration.get('activated'):
+                    self._registered_ack = True
+                
                 if result.get('success'):
                     claim_url = result.get('claimUrl') or result.get('qrCodeUrl')
                     claim_id = result.get('claimId')
@@ -1234,11 +1867,12 @@ class CameraApp(App):
                         # Store claim for polling
                         self.active_claims[claim_id] = image_id
                         
-                        # Show success message
-                        Clock.schedule_once(
-                            lambda dt: setattr(self.status_label, 'text', '✓ Uploaded! Minting...'),
-                            0
-                        )
+                        # Show success message and start polling for claim
+                        # status (to show when minted) in one UI pass
+                        def apply_uploaded_state(dt):
+                            self.status_label.text = '✓ Uploaded! Minting...'
+                            self._start_claim_polling(claim_id)
+                        Clock.schedule_once(apply_uploaded_state, 0)
                         
                         # Note: NFT will be minted to owner wallet automatically by backend
                         # QR code is for others to mint editions
@@ -1248,15 +1882,9 @@ class CameraApp(App):
                             lambda dt: self._show_qr_code(claim_url, claim_id),
                             2
                         )
-                        
-                        # Start polling for claim status (to show when minted)
-                        Clock.schedule_once(
-                            lambda dt: self._start_claim_polling(claim_id),
-                            0
-                        )
                     else:
                         Clock.schedule_once(
-                            lambda dt: setattr(self.status_label, 'text', '✓ Saved (No Claim)'),
+                            partial(self._set_status, '✓ Saved (No Claim)'),
                             0
                         )
                 else:
@@ -1266,24 +1894,10 @@ class CameraApp(App):
                 
         except requests.exceptions.RequestException as e:
             print(f"Upload error: {e}")
-            Clock.schedule_once(
-                lambda dt: setattr(self.status_label, 'text', '✗ Upload Failed'),
-                0
-            )
-            Clock.schedule_once(
-                lambda dt: setattr(self.status_label, 'text', ''),
-                3
-            )
+            Clock.schedule_once(partial(self._flash_status, '✗ Upload Failed', 3), 0)
         except Exception as e:
             print(f"Error uploading: {e}")
-            Clock.schedule_once(
-                lambda dt: setattr(self.status_label, 'text', '✗ Error'),
-                0
-            )
-            Clock.schedule_once(
-                lambda dt: setattr(self.status_label, 'text', ''),
-                3
-            )
+            Clock.schedule_once(partial(self._flash_status, '✗ Error', 3), 0)
     
     def _show_qr_code(self, claim_url, claim_id):
         """Display QR code overlay."""
@@ -1294,32 +1908,8 @@ class CameraApp(App):
             return
         
         try:
-            # Generate QR code
-            qr = qrcode.QRCode(
-                version=1,
-                error_correction=qrcode.constants.ERROR_CORRECT_L,
-                box_size=10,
-                border=4,
-            )
-            qr.add_data(claim_url)
-            qr.make(fit=True)
-            
-            # Create image
-            img = qr.make_image(fill_color="black", back_color="white")
-            
-            # Convert to bytes
-            img_bytes = BytesIO()
-            img.save(img_bytes, format='PNG')
-            img_bytes.seek(0)
-            
-            # Save to temp file for Kivy
-            temp_path = Path(CAPTURE_DIR) / f"qr_{claim_id}.png"
-            with open(temp_path, 'wb') as f:
-                f.write(img_bytes.read())
-            
-            # Load in Kivy
-            self.qr_image.source = str(temp_path)
-            self.qr_image.reload()
+            # Load in Kivy (cached PNG, see _qr_png)
+            self.qr_image.source = str(self._qr_png(claim_url))
             
             # Update title and status
             self.qr_title.text = '📱 Scan to Claim NFT'
@@ -1338,71 +1928,88 @@ class CameraApp(App):
         """Close QR code overlay."""
         self.qr_overlay.opacity = 0
     
-    def _start_claim_polling(self, claim_id):
-        """Start polling for claim status."""
-        def poll_claim(dt):
-            if claim_id not in self.active_claims:
-                return False  # Stop polling
+    def _apply_claim_status(self, claim_id, result):
+        """Update the claim QR overlay from a claim check result."""
+        status = result.get('status')
+        recipient = result.get('recipient_address')
+        
+        if status == 'claimed' and recipient:
+            self.qr_status.text = f'✓ Address received!\nMinting NFT to:\n{recipient[:10]}...{recipient[-8:]}'
+            self.qr_status.color = (0, 1, 0, 1)  # Green
+        elif status == 'completed':
+            token_id = result.get('token_id')
+            self.qr_status.text = f'🎉 Original Minted!\nToken ID: {token_id}\n\nScan QR to mint editions'
+            self.qr_status.color = (0, 1, 0, 1)  # Green
             
-            try:
-                response = requests.get(
-                    f'{BACKEND_URL}/api/claims/check',
-                    params={'claim_id': claim_id},
-                    timeout=5
+            # Update status label
+            Clock.schedule_once(
+                partial(self._set_status, f'✓ Minted #{token_id}'),
+                0
+            )
+            
+            # Clear status label after 10 seconds (only once per claim)
+            if claim_id not in self.cleared_mint_status:
+                Clock.schedule_once(
+                    self._clear_status,
+                    10
                 )
+                self.cleared_mint_status.add(claim_id)
+            
+            # Keep QR code visible for others to mint editions
+            # Don't stop polling - keep showing QR for edition minting
+        else:
+            self.qr_status.text = 'Waiting for wallet address...'
+            self.qr_status.color = (1, 1, 1, 1)  # White
+    
+    def _start_claim_polling(self, claim_id):
+        """Add a claim to the batched status poller (started on first use)."""
+        # active_claims already holds every claim being tracked; the single
+        # poller below checks all of them in one request per interval
+        if self._claim_poll_event is None:
+            self._claim_poll_event = Clock.schedule_interval(self._poll_claims_batch, CLAIM_POLL_INTERVAL)
+        if self._events_connected:
+            self._subscribe_claims([claim_id], self._events_generation)
+    
+    def _poll_claims_batch(self, dt):
+        # The event stream pushes updates for claims the backend has confirmed
+        # it is watching; everything else is still polled
+        if self._events_connected:
+            claim_ids = [c for c in self.active_claims if c not in self._watched_claims]
+        else:
+            claim_ids = list(self.active_claims)
+        if not claim_ids:
+            return True
+        
+        try:
+            response = self.http.post(
+                f'{BACKEND_URL}/api/claims/check_batch',
+                json={'claim_ids': claim_ids},
+                timeout=5
+            )
+            
+            if response.status_code == 200:
+                result = response.json()
                 
-                if response.status_code == 200:
-                    result = response.json()
-                    
-                    if result.get('success'):
-                        status = result.get('status')
-                        recipient = result.get('recipient_address')
+                if result.get('success'):
+                    for claim in result.get('claims', []):
+                        claim_id = claim.get('claim_id')
+                        if claim_id in self.active_claims and claim.get('success'):
+                            self._apply_claim_status(claim_id, claim)
                         
-                        if status == 'claimed' and recipient:
-                            self.qr_status.text = f'✓ Address received!\nMinting NFT to:\n{recipient[:10]}...{recipient[-8:]}'
-                            self.qr_status.color = (0, 1, 0, 1)  # Green
-                        elif status == 'completed':
-                            token_id = result.get('token_id')
-                            self.qr_status.text = f'🎉 Original Minted!\nToken ID: {token_id}\n\nScan QR to mint editions'
-                            self.qr_status.color = (0, 1, 0, 1)  # Green
-                            
-                            # Update status label
-                            Clock.schedule_once(
-                                lambda dt: setattr(self.status_label, 'text', f'✓ Minted #{token_id}'),
-                                0
-                            )
-                            
-                            # Clear status label after 10 seconds (only once per claim)
-                            if claim_id not in self.cleared_mint_status:
-                                Clock.schedule_once(
-                                    lambda dt: setattr(self.status_label, 'text', ''),
-                                    10
-                                )
-                                self.cleared_mint_status.add(claim_id)
-                            
-                            # Keep QR code visible for others to mint editions
-                            # Don't stop polling - keep showing QR for edition minting
-                            # del self.active_claims[claim_id]
-                            # return False
-                        else:
-                            self.qr_status.text = 'Waiting for wallet address...'
-                            self.qr_status.color = (1, 1, 1, 1)  # White
-                            
-            except Exception as e:
-                print(f"Polling error: {e}")
-            
-            return True  # Continue polling
+        except Exception as e:
+            print(f"Polling error: {e}")
         
-        # Schedule polling
-        Clock.schedule_interval(poll_claim, CLAIM_POLL_INTERVAL)
+        return True  # Continue polling
     
-    def _sign_image(self, image_path):
+    def _sign_image(self, image_path, image_data=None, image_hash=None):
         """
         Sign an image file with hardware identity.
         Creates a signature file alongside the image.
         
         Args:
             image_path: Path to image file
+            image_data: Encoded image bytes, if already in memory
+            image_hash: SHA256 digest of the image, if already computed
             
         Returns:
             dict: Signature information
@@ -1411,12 +2018,15 @@ class CameraApp(App):
             return None
         
         try:
-            # Read image file and compute hash
-            with open(image_path, 'rb') as f:
-                image_data = f.read()
-            
-            # Compute SHA256 hash of image
-            image_hash = hashlib.sha256(image_data).digest()
+            # Compute SHA256 hash of image unless the writer already did:
+            # from the encoded bytes when the caller has them, otherwise
+            # straight off the file without materialising it in Python
+            if image_hash is None:
+                if image_data is not None:
+                    image_hash = hashlib.sha256(image_data).digest()
+                else:
+                    with open(image_path, 'rb') as f:
+                        image_hash = _file_sha256(f).digest()
             image_hash_hex = image_hash.hex()
             
             # Sign the hash
@@ -1451,10 +2061,11 @@ class CameraApp(App):
             else:
                 self.status_label.text = '✗ Failed'
                 self.status_label.color = (1, 1, 1, 1)
-                Clock.schedule_once(lambda dt: setattr(self.status_label, 'text', ''), 2)
+                Clock.schedule_once(self._clear_status, 2)
         else:
             # Stop recording
             self.camera.stop_recording()
+            self._invalidate_gallery()
             self.video_button.text = 'VIDEO'
             self.video_button.background_color = (0.6, 0.2, 0.2, 1)
             self.status_label.text = '✓ Saved'
@@ -1462,7 +2073,7 @@ class CameraApp(App):
 
             # Reset status after 2 seconds
             Clock.schedule_once(
-                lambda dt: setattr(self.status_label, 'text', ''),
+                self._clear_status,
                 2
             )
 
@@ -1471,7 +2082,7 @@ class CameraApp(App):
         self.camera.zoom_in()
         self.status_label.text = f'🔍 {self.camera.current_zoom:.1f}x'
         Clock.schedule_once(
-            lambda dt: setattr(self.status_label, 'text', ''),
+            self._clear_status,
             1
         )
 
@@ -1480,7 +2091,7 @@ class CameraApp(App):
         self.camera.zoom_out()
         self.status_label.text = f'🔍 {self.camera.current_zoom:.1f}x'
         Clock.schedule_once(
-            lambda dt: setattr(self.status_label, 'text', ''),
+            self._clear_status,
             1
         )
 
@@ -1492,6 +2103,21 @@ class CameraApp(App):
 
     def open_gallery(self, instance):
         """Open gallery view to browse photos and videos."""
+        # Built on first open and kept for later ones
+        if self.gallery_overlay is None:
+            self._build_gallery_overlay()
+
+        # Load media files
+        self.load_gallery_items()
+
+        if self.gallery_overlay.parent is None:
+            self.root_layout.add_widget(self.gallery_overlay)
+
+    def _gallery_open(self):
+        return self.gallery_overlay is not None and self.gallery_overlay.parent is not None
+
+    def _build_gallery_overlay(self):
+        """Build the gallery overlay, grid and top bar (once, on first open)."""
         # Create gallery overlay
         self.gallery_overlay = FloatLayout()
 
@@ -1527,7 +2153,7 @@ class CameraApp(App):
             bold=True,
             text_size=(None, None)
         )
-        title.bind(size=title.setter('text_size'))
+        title.bind(size=_sync_text_size)
 
         # Quit Gallery button - goes back to camera
         quit_gallery_button = Button(
@@ -1542,7 +2168,7 @@ class CameraApp(App):
             halign='center',
             valign='middle'
         )
-        quit_gallery_button.bind(size=quit_gallery_button.setter('text_size'))
+        quit_gallery_button.bind(size=_sync_text_size)
         quit_gallery_button.bind(on_press=self.quit_gallery)
 
         # Close button
@@ -1558,145 +2184,249 @@ class CameraApp(App):
             halign='center',
             valign='middle'
         )
-        close_button.bind(size=close_button.setter('text_size'))
+        close_button.bind(size=_sync_text_size)
         close_button.bind(on_press=self.close_gallery)
 
         top_bar.add_widget(title)
         top_bar.add_widget(quit_gallery_button)
         top_bar.add_widget(close_button)
 
-        # Scrollable grid of thumbnails
-        self.gallery_scroll_view = ScrollView(
-            size_hint=(1, 0.88),
+        # Scrollable grid of thumbnails; only the visible cells are real widgets
+        gallery_area = FloatLayout(size_hint=(1, 0.88))
+
+        self.gallery_rv = RecycleView(
+            size_hint=(1, 1),
+            pos_hint={'x': 0, 'y': 0},
             bar_width=10,
             scroll_type=['bars', 'content']
         )
+        self.gallery_rv.viewclass = GalleryCell
 
-        self.gallery_grid = GridLayout(
+        self.gallery_grid = RecycleGridLayout(
             cols=3,
             spacing=15,
-            size_hint_y=None,
-            padding=15
+            padding=15,
+            default_size=(None, 250),
+            default_size_hint=(1, None),
+            size_hint_y=None
         )
         self.gallery_grid.bind(minimum_height=self.gallery_grid.setter('height'))
+        self.gallery_rv.add_widget(self.gallery_grid)
 
-        # Load media files
-        self.load_gallery_items()
+        self.gallery_empty_label = Label(
+            text='📷\n\nNo photos or videos yet\n\nTake some photos to see them here!',
+            font_size='24sp',
+            halign='center',
+            valign='middle',
+            color=(0.8, 0.8, 0.8, 1),
+            size_hint=(1, 1),
+            pos_hint={'x': 0, 'y': 0},
+            opacity=0
+        )
+        self.gallery_empty_label.bind(size=_sync_text_size)
+
+        gallery_area.add_widget(self.gallery_rv)
+        gallery_area.add_widget(self.gallery_empty_label)
 
-        self.gallery_scroll_view.add_widget(self.gallery_grid)
         gallery_container.add_widget(top_bar)
-        gallery_container.add_widget(self.gallery_scroll_view)
+        gallery_container.add_widget(gallery_area)
 
         self.gallery_overlay.add_widget(gallery_container)
-        self.root_layout.add_widget(self.gallery_overlay)
 
     def load_gallery_items(self):
-        """Load and display photos and videos from capture directory."""
-        # Clear existing items
-        self.gallery_grid.clear_widgets()
-
-        # Get all photos and videos
-        photos = sorted(glob.glob(str(CAPTURE_DIR / "photo_*.jpg")), reverse=True)
-        videos = sorted(glob.glob(str(CAPTURE_DIR / "video_*.h264")), reverse=True)
-
-        all_media = []
-        for photo in photos:
-            all_media.append(('photo', photo))
-        for video in videos:
-            all_media.append(('video', video))
-
-        # Sort by filename (which includes timestamp)
-        all_media.sort(key=lambda x: x[1], reverse=True)
-
-        if not all_media:
-            # No files found - better styled message
-            no_files_label = Label(
-                text='📷\n\nNo photos or videos yet\n\nTake some photos to see them here!',
-                font_size='24sp',
-                halign='center',
-                valign='middle',
-                color=(0.8, 0.8, 0.8, 1),
-                size_hint_y=None,
-                height=300
-            )
-            no_files_label.bind(size=no_files_label.setter('text_size'))
-            self.gallery_grid.add_widget(no_files_label)
-            return
-
-        # Add media items
-        for media_type, filepath in all_media:
-            item_layout = BoxLayout(
-                orientation='vertical',
-                size_hint_y=None,
-                height=250,
-                spacing=8
-            )
-
-            # Thumbnail button with better styling
-            if media_type == 'photo':
-                thumb_button = Button(
-                    background_normal=filepath,
-                    background_down=filepath,
-                    size_hint=(1, 0.88),
-                    border=(0, 0, 0, 0)
-                )
-                thumb_button.filepath = filepath
-                thumb_button.media_type = media_type
-                thumb_button.bind(on_press=self.view_media)
+        """Load photos and videos from capture directory into the gallery."""
+        # Reuse the last listing unless a capture/delete invalidated it or the
+        # directory changed behind our back (its mtime moves on add/remove)
+        try:
+            dir_mtime = os.stat(CAPTURE_DIR).st_mtime_ns
+        except OSError:
+            dir_mtime = None
+        if self._gallery_cache is None or dir_mtime != self._gallery_cache_mtime:
+            scanned_at = time.time()
+            self._gallery_cache = self._scan_gallery_media()
+            self._gallery_cache_mtime = dir_mtime
+            # Fresh listing doubles as the live set for trimming old copies
+            photos = {os.path.basename(item['filepath'])
+                      for item in self._gallery_cache if item['media_type'] == 'photo'}
+            self._thumb_pool.submit(self._prune_derived_images, photos, scanned_at)
+        data = self._gallery_cache
+
+        # No files found - show the placeholder message instead
+        self.gallery_empty_label.opacity = 0 if data else 1
+        self.gallery_rv.data = data
+
+    def _invalidate_gallery(self, *args):
+        self._gallery_cache = None
+
+    def _remove_gallery_item(self, filepath):
+        """Drop one deleted file from the cached listing and the open gallery."""
+        def splice(items):
+            for i, item in enumerate(items):
+                if item['filepath'] == filepath:
+                    del items[i]
+                    return
+
+        if self.gallery_overlay is not None:
+            # rv.data is its own copy of the list (the item dicts are shared);
+            # deleting from it refreshes the view by itself
+            splice(self.gallery_rv.data)
+            self.gallery_empty_label.opacity = 0 if self.gallery_rv.data else 1
+
+        if self._gallery_cache is not None:
+            splice(self._gallery_cache)
+            # Our own delete moved the directory mtime; don't rescan for it
+            try:
+                self._gallery_cache_mtime = os.stat(CAPTURE_DIR).st_mtime_ns
+            except OSError:
+                self._gallery_cache = None
 
-                # Label with better formatting
-                filename = os.path.basename(filepath)
-                # Extract date and time from filename
+    def _prune_derived_images(self, photos, scanned_at):
+        """Keep .thumbnails/ and .views/ within budget (runs on the thumbnail pool)."""
+        try:
+            evicted = _prune_derived_dir(THUMB_DIR, photos, THUMB_CACHE_BYTES, scanned_at)
+            _prune_derived_dir(VIEW_DIR, photos, VIEW_CACHE_BYTES, scanned_at)
+        except Exception as e:
+            gallery_logger.warning("Could not prune thumbnails: %s", e)
+            return
+        if evicted:
+            for name in evicted:
+                self._thumb_mtimes.pop(os.path.join(CAPTURE_DIR, name), None)
+            # The cached listing may point at thumbnails that are now gone
+            Clock.schedule_once(self._invalidate_gallery, 0)
+
+    def _scan_gallery_media(self):
+        """Build RecycleView data for every photo and video, newest first."""
+        # Get all photos and videos in one directory pass, with the one stat
+        # per entry that everything below (sort, thumbnail check) reuses
+        entries = []
+        with os.scandir(CAPTURE_DIR) as it:
+            for entry in it:
+                name = entry.name
+                if name.startswith('photo_') and name.endswith('.jpg'):
+                    media_type = 'photo'
+                elif name.startswith('video_') and name.endswith('.h264'):
+                    media_type = 'video'
+                else:
+                    continue
                 try:
-                    date_part = filename[6:14]  # YYYYMMDD
-                    time_part = filename[15:21]  # HHMMSS
-                    label_text = f'📷 {date_part} {time_part}'
-                except:
-                    label_text = f'📷 {filename[6:21]}'
+                    st = entry.stat()
+                except OSError:
+                    continue  # Removed while we were listing
+                entries.append((st.st_mtime, name, media_type, entry.path, st.st_size))
+
+        # Newest first by capture (modification) time, name as tie-break
+        entries.sort(reverse=True)
+
+        # Plain dicts only; GalleryCell widgets are bound to them on scroll
+        data = []
+        for mtime, filename, media_type, filepath, size in entries:
+            icon = '📷' if media_type == 'photo' else '🎥'
+            # Extract date and time (YYYYMMDD HHMMSS) from filename
+            m = _MEDIA_NAME_RE.match(filename)
+            if m:
+                label_text = f'{icon} {m.group(1)} {m.group(2)}'
             else:
-                # Video placeholder with better styling
-                thumb_button = Button(
-                    text='▶️\nVIDEO',
-                    font_size='28sp',
-                    background_color=(0.15, 0.15, 0.25, 1),
-                    background_normal='',
-                    size_hint=(1, 0.88),
-                    color=(1, 1, 1, 1),
-                    bold=True
-                )
-                thumb_button.filepath = filepath
-                thumb_button.media_type = media_type
-                thumb_button.bind(on_press=self.view_media)
+                label_text = f'{icon} {filename[6:21]}'
+
+            item = {
+                'filepath': filepath,
+                'media_type': media_type,
+                'thumb': filepath,
+                'label_text': label_text,
+                'mtime': mtime,
+                'file_size': size
+            }
+            if media_type == 'photo':
+                thumb = self._fresh_thumbnail(filepath, mtime)
+                if thumb:
+                    item['thumb'] = thumb
+                else:
+                    # Placeholder tile until the thumbnail pool has made one
+                    item['thumb'] = ''
+                    self._queue_thumbnail(item)
+            data.append(item)
+        return data
+
+    def _queue_thumbnail(self, item):
+        filepath = item['filepath']
+        if filepath in self._thumb_pending:
+            return
+        self._thumb_pending.add(filepath)
+        future = self._thumb_pool.submit(self._ensure_thumbnail, filepath)
+        future.add_done_callback(
+            lambda f, i=item: Clock.schedule_once(partial(self._on_thumbnail_ready, i, f), 0)
+        )
 
-                filename = os.path.basename(filepath)
-                try:
-                    date_part = filename[6:14]
-                    time_part = filename[15:21]
-                    label_text = f'🎥 {date_part} {time_part}'
-                except:
-                    label_text = f'🎥 {filename[6:21]}'
-
-            label = Label(
-                text=label_text,
-                font_size='14sp',
-                size_hint=(1, 0.12),
-                color=(1, 1, 1, 1),
-                halign='center',
-                valign='middle'
-            )
-            label.bind(size=label.setter('text_size'))
+    def _on_thumbnail_ready(self, item, future, *args):
+        self._thumb_pending.discard(item['filepath'])
+        if future.cancelled():
+            return
+        item['thumb'] = future.result()
+        # Coalesces a burst of finished thumbnails into one view refresh
+        self._gallery_refresh_trigger()
 
-            item_layout.add_widget(thumb_button)
-            item_layout.add_widget(label)
+    def _refresh_gallery_view(self, *args):
+        if self._gallery_open():
+            self.gallery_rv.refresh_from_data()
 
-            self.gallery_grid.add_widget(item_layout)
+    def _fresh_thumbnail(self, filepath, mtime=None):
+        """
+        Return the thumbnail path if it is up to date with the photo, else None.
 
-    def view_media(self, instance):
-        """View selected photo or video in full screen."""
-        filepath = instance.filepath
-        media_type = instance.media_type
+        mtime is the photo's st_mtime when the caller has already stat'd it.
+        """
+        try:
+            if mtime is None:
+                mtime = os.stat(filepath).st_mtime
+            # Already checked against this version of the photo
+            if self._thumb_mtimes.get(filepath) == mtime:
+                return str(_thumbnail_path(filepath))
+
+            thumb_path = _thumbnail_path(filepath)
+            if thumb_path.stat().st_mtime >= mtime:
+                self._thumb_mtimes[filepath] = mtime
+                return str(thumb_path)
+        except OSError:
+            pass
+        return None
+
+    def _ensure_thumbnail(self, filepath):
+        """
+        Return the thumbnail for a photo, building it if missing or stale.
 
-        # Create full screen viewer - add to gallery overlay, not root
+        Runs on the thumbnail pool; falls back to the photo itself on error.
+        """
+        try:
+            thumb = self._fresh_thumbnail(filepath)
+            if thumb:
+                return thumb
+
+            mtime = os.stat(filepath).st_mtime
+            thumb_path = _thumbnail_path(filepath)
+            if self._fresh_view(filepath, mtime):
+                # Captures predating thumbnails (or edited since): let libjpeg
+                # decode at 1/4 scale rather than producing every full-size pixel
+                image = cv2.imread(filepath, cv2.IMREAD_REDUCED_COLOR_4)
+                if image is None:
+                    return filepath
+            else:
+                # The viewer copy is missing too (imported, or captured before
+                # it existed), so pay for one full decode and build both here
+                image = cv2.imread(filepath)
+                if image is None:
+                    return filepath
+                if max(image.shape[:2]) > VIEW_SIZE:
+                    image = _write_scaled_jpeg(image, _view_path(filepath), VIEW_SIZE, 85)
+            _write_thumbnail(image, thumb_path)
+
+            self._thumb_mtimes[filepath] = mtime
+            return str(thumb_path)
+        except Exception as e:
+            gallery_logger.warning("Could not create thumbnail for %s: %s", filepath, e)
+            return filepath
+
+    def _build_viewer(self):
+        """Build the full screen viewer once; view_media only swaps its content."""
         self.viewer_overlay = FloatLayout()
 
         with self.viewer_overlay.canvas.before:
@@ -1709,33 +2439,33 @@ class CameraApp(App):
             spacing=0
         )
 
-        # Media display
-        if media_type == 'photo':
-            media_widget = Image(
-                source=filepath,
-                allow_stretch=True,
-                keep_ratio=True,
-                size_hint=(1, 0.92)
-            )
-            # Prevent touch events from causing navigation
-            media_widget.bind(on_touch_down=lambda w, t: True)  # Consume touch events
-        else:
-            # Simple video info display with better styling
-            media_widget = BoxLayout(
-                orientation='vertical',
-                size_hint=(1, 0.92),
-                padding=50
-            )
-            video_info = Label(
-                text=f'🎥\n\nVideo File\n\n{os.path.basename(filepath)}\n\n✓ Video recorded successfully!\n✓ File saved to captures folder',
-                font_size='22sp',
-                halign='center',
-                valign='middle',
-                color=(1, 1, 1, 1),
-                bold=True
-            )
-            video_info.bind(size=video_info.setter('text_size'))
-            media_widget.add_widget(video_info)
+        # Media display; holds either the photo or the video info below
+        self._viewer_media = BoxLayout(size_hint=(1, 0.92))
+
+        # nocache keeps the full-size texture out of Kivy's image cache,
+        # so it is freed as soon as the viewer lets go of it
+        self._viewer_image = Image(
+            allow_stretch=True,
+            keep_ratio=True,
+            nocache=True
+        )
+        # Prevent touch events from causing navigation
+        self._viewer_image.bind(on_touch_down=lambda w, t: True)  # Consume touch events
+
+        # Simple video info display with better styling
+        self._viewer_video = BoxLayout(
+            orientation='vertical',
+            padding=50
+        )
+        self._viewer_video_info = Label(
+            font_size='22sp',
+            halign='center',
+            valign='middle',
+            color=(1, 1, 1, 1),
+            bold=True
+        )
+        self._viewer_video_info.bind(size=_sync_text_size)
+        self._viewer_video.add_widget(self._viewer_video_info)
 
         # Bottom controls with better styling
         controls = BoxLayout(
@@ -1757,11 +2487,10 @@ class CameraApp(App):
             halign='center',
             valign='middle'
         )
-        back_button.bind(size=back_button.setter('text_size'))
-        # Use a lambda to ensure the event is handled and doesn't propagate
-        back_button.bind(on_press=lambda btn: self.close_viewer(btn))
+        back_button.bind(size=_sync_text_size)
+        back_button.bind(on_press=self.close_viewer)
 
-        delete_button = Button(
+        self._viewer_delete_button = Button(
             text='🗑 Delete',
             font_size='18sp',
             size_hint=(0.3, 1),
@@ -1773,23 +2502,97 @@ class CameraApp(App):
             halign='center',
             valign='middle'
         )
-        delete_button.bind(size=delete_button.setter('text_size'))
-        delete_button.filepath = filepath
-        delete_button.bind(on_press=self.delete_media)
+        self._viewer_delete_button.bind(size=_sync_text_size)
+        self._viewer_delete_button.filepath = None
+        self._viewer_delete_button.bind(on_press=self.delete_media)
+
+        # Photos open as the screen-sized copy; this loads the full file
+        self._viewer_original_button = Button(
+            text='🔍 Original',
+            font_size='18sp',
+            size_hint=(0.2, 1),
+            background_color=(0.3, 0.3, 0.3, 1),
+            background_normal='',
+            color=(1, 1, 1, 1),
+            bold=True,
+            text_size=(None, None),
+            halign='center',
+            valign='middle'
+        )
+        self._viewer_original_button.bind(size=_sync_text_size)
+        self._viewer_original_button.bind(on_press=self._view_original)
 
-        spacer = Label(size_hint=(0.4, 1))
+        spacer = Label(size_hint=(0.2, 1))
 
         controls.add_widget(back_button)
         controls.add_widget(spacer)
-        controls.add_widget(delete_button)
+        controls.add_widget(self._viewer_original_button)
+        controls.add_widget(self._viewer_delete_button)
 
-        viewer_container.add_widget(media_widget)
+        viewer_container.add_widget(self._viewer_media)
         viewer_container.add_widget(controls)
 
         self.viewer_overlay.add_widget(viewer_container)
+
+    def _fresh_view(self, filepath, mtime=None):
+        """
+        Return the viewer copy's path if it is up to date with the photo, else None.
+
+        mtime is the photo's st_mtime when the caller has already stat'd it.
+        """
+        view_path = _view_path(filepath)
+        try:
+            if mtime is None:
+                mtime = os.stat(filepath).st_mtime
+            if view_path.stat().st_mtime >= mtime:
+                return str(view_path)
+        except OSError:
+            pass
+        return None
+
+    def _viewer_source(self, filepath):
+        """Screen-sized copy of a photo if it is up to date, else the photo."""
+        return self._fresh_view(filepath) or filepath
+
+    def _view_original(self, instance):
+        self._viewer_image.source = self._viewer_delete_button.filepath
+        self._viewer_original_button.opacity = 0
+        self._viewer_original_button.disabled = True
+
+    def view_media(self, instance):
+        """View selected photo or video in full screen."""
+        filepath = instance.filepath
+        media_type = instance.media_type
+
+        if self.viewer_overlay is None:
+            self._build_viewer()
+
+        # Swap in the selected item
+        self._viewer_media.clear_widgets()
+        if media_type == 'photo':
+            source = self._viewer_source(filepath)
+            self._viewer_image.source = source
+            self._viewer_media.add_widget(self._viewer_image)
+            # Only offer the original when we are showing a smaller copy
+            has_original = source != filepath
+            self._viewer_original_button.opacity = 1 if has_original else 0
+            self._viewer_original_button.disabled = not has_original
+        else:
+            self._viewer_original_button.opacity = 0
+            self._viewer_original_button.disabled = True
+            self._viewer_video_info.text = (
+                f'🎥\n\nVideo File\n\n{os.path.basename(filepath)}'
+                '\n\n✓ Video recorded successfully!\n✓ File saved to captures folder'
+            )
+            self._viewer_media.add_widget(self._viewer_video)
+        self._viewer_delete_button.filepath = filepath
+
+        if self.viewer_overlay.parent:
+            self.viewer_overlay.parent.remove_widget(self.viewer_overlay)
+
         # Add viewer to gallery overlay so gallery stays underneath
         # This ensures when we close viewer, gallery is still there
-        if hasattr(self, 'gallery_overlay'):
+        if self._gallery_open():
             # Make sure gallery overlay is visible first
             self.gallery_overlay.opacity = 1
             # Add viewer on top of gallery
@@ -1800,87 +2603,72 @@ class CameraApp(App):
 
     def close_viewer(self, instance):
         """Close media viewer and return to gallery grid."""
-        print("Closing viewer and returning to gallery grid...")
-        
-        # Store reference to viewer overlay before removal
-        viewer_to_remove = None
-        if hasattr(self, 'viewer_overlay'):
-            viewer_to_remove = self.viewer_overlay
-        
-        # Remove viewer overlay from wherever it is
-        if viewer_to_remove:
-            try:
-                # Try to remove from gallery overlay first
-                if hasattr(self, 'gallery_overlay') and viewer_to_remove.parent == self.gallery_overlay:
-                    self.gallery_overlay.remove_widget(viewer_to_remove)
-                    print("Removed viewer from gallery overlay")
-                # Try to remove from root layout
-                elif viewer_to_remove.parent == self.root_layout:
-                    self.root_layout.remove_widget(viewer_to_remove)
-                    print("Removed viewer from root layout")
-                # Fallback: try to remove from children list
-                elif hasattr(self, 'gallery_overlay') and viewer_to_remove in self.gallery_overlay.children:
-                    self.gallery_overlay.remove_widget(viewer_to_remove)
-                    print("Removed viewer from gallery overlay (fallback)")
-                elif viewer_to_remove in self.root_layout.children:
-                    self.root_layout.remove_widget(viewer_to_remove)
-                    print("Removed viewer from root layout (fallback)")
-            except Exception as e:
-                print(f"Error removing viewer overlay: {e}")
-            finally:
-                # Clean up the viewer overlay reference
-                if hasattr(self, 'viewer_overlay'):
-                    del self.viewer_overlay
+        gallery_logger.debug("Closing viewer and returning to gallery grid")
         
+        # The viewer is kept for reuse; just detach it from wherever it is
+        if self.viewer_overlay is not None and self.viewer_overlay.parent:
+            self.viewer_overlay.parent.remove_widget(self.viewer_overlay)
+            gallery_logger.debug("Removed viewer overlay")
+
+        # Drop the photo's GPU texture now rather than on the next open
+        if self._viewer_image is not None:
+            self._viewer_image.source = ''
+            self._viewer_image.texture = None
+
         # Ensure gallery grid is visible and properly displayed
-        if hasattr(self, 'gallery_overlay'):
-            # Make sure gallery overlay is visible and on top
-            self.gallery_overlay.opacity = 1
-            # Ensure gallery grid exists and is visible
-            if hasattr(self, 'gallery_grid'):
-                self.gallery_grid.opacity = 1
-                # Make sure grid is enabled and can receive events
-                self.gallery_grid.disabled = False
-            # Ensure scroll view is also visible if it exists
-            if hasattr(self, 'gallery_scroll_view'):
-                self.gallery_scroll_view.opacity = 1
-                self.gallery_scroll_view.disabled = False
+        gallery = self.gallery_overlay
+        if self._gallery_open():
+            # Make sure gallery overlay and its grid are visible and can
+            # receive events (the grid is always built with the overlay)
+            gallery.opacity = 1
+            self.gallery_rv.opacity = 1
+            self.gallery_rv.disabled = False
             # Bring gallery overlay to front to ensure it's visible
-            if self.gallery_overlay.parent:
-                self.gallery_overlay.parent.remove_widget(self.gallery_overlay)
-                self.root_layout.add_widget(self.gallery_overlay)
-            print("Gallery grid should now be visible")
+            parent = gallery.parent
+            if parent:
+                parent.remove_widget(gallery)
+                self.root_layout.add_widget(gallery)
+            gallery_logger.debug("Gallery grid should now be visible")
 
     def delete_media(self, instance):
         """Delete selected media file."""
         filepath = instance.filepath
         try:
-            os.remove(filepath)
-            print(f"Deleted: {filepath}")
+            # Freeing a multi-MB file's blocks can stall an SD card for tens
+            # of ms, so only rename here and unlink on the thumbnail pool
+            _move_to_trash(filepath)
+            gallery_logger.info("Deleted: %s", filepath)
+
+            # Drop the gallery thumbnail and viewer copy along with it
+            self._thumb_mtimes.pop(filepath, None)
+            for derived in (_thumbnail_path(filepath), _view_path(filepath)):
+                try:
+                    _move_to_trash(derived)
+                except FileNotFoundError:
+                    pass
+            self._thumb_pool.submit(_empty_trash)
 
             # Close viewer
             self.close_viewer(instance)
 
-            # Reload gallery
-            self.load_gallery_items()
+            # Splice the one item out instead of rescanning the directory
+            self._remove_gallery_item(filepath)
         except Exception as e:
-            print(f"Error deleting file: {e}")
+            gallery_logger.error("Error deleting file: %s", e)
 
     def quit_gallery(self, instance):
         """Quit gallery and return to camera view."""
-        if hasattr(self, 'gallery_overlay'):
+        if self._gallery_open():
+            # Kept built for the next open
             self.root_layout.remove_widget(self.gallery_overlay)
-            del self.gallery_overlay
         # Ensure camera preview is visible
-        if hasattr(self, 'preview_image'):
-            self.preview_image.opacity = 1
-        print("Returned to camera view from gallery")
+        self.preview_image.opacity = 1
+        gallery_logger.debug("Returned to camera view from gallery")
 
     def close_gallery(self, instance):
         """Close gallery view."""
-        if hasattr(self, 'gallery_overlay'):
+        if self._gallery_open():
             self.root_layout.remove_widget(self.gallery_overlay)
-            del self.gallery_overlay
 
     def quit_app(self, instance):
         """Quit the application cleanly."""
@@ -1890,6 +2678,8 @@ class CameraApp(App):
 
     def on_stop(self):
         """Clean up when app closes."""
+        self._io_pool.shutdown(wait=False)
+        self._thumb_pool.shutdown(wait=False, cancel_futures=True)
         if self.camera:
             try:
                 self.camera.cleanup()
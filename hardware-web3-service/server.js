@@ -234,6 +234,98 @@ function startClaimPolling() {
   console.log('✅ Claim polling started');
 }
 
+// Server-sent event stream for the camera app. While at least one device is
+// connected, a single watcher checks the ETH balance until it is sufficient
+// and the claims created by recent uploads until they complete, and pushes
+// only the changes. Background registrations started by uploads report
+// their outcome here too. Devices fall back to polling when the stream drops.
+const EVENT_POLL_INTERVAL = parseInt(process.env.EVENT_POLL_INTERVAL || '5000', 10);
+const WATCHED_CLAIM_TTL = parseInt(process.env.WATCHED_CLAIM_TTL || '3600000', 10);
+const eventClients = new Set();
+const watchedClaims = new Map();
+let lastBalanceEth = null;
+let balanceReady = false;
+let eventWatcherInterval = null;
+let eventWatcherRunning = false;
+
+function publishEvent(type, payload) {
+  const message = `event: ${type}\ndata: ${JSON.stringify(payload)}\n\n`;
+  for (const client of eventClients) {
+    client.write(message);
+  }
+}
+
+function watchClaim(claimId) {
+  watchedClaims.set(claimId, { status: null, addedAt: Date.now() });
+}
+
+async function checkWatchedBalance() {
+  const ethBalance = await web3Service.getDeviceBalance();
+  if (!ethBalance) return;
+
+  const balanceEth = parseFloat(ethBalance.balance);
+  const minEthBalance = parseFloat(process.env.MIN_ETH_BALANCE || '0.01');
+  const ready = balanceEth >= minEthBalance;
+
+  if (balanceEth !== lastBalanceEth || ready) {
+    lastBalanceEth = balanceEth;
+    balanceReady = ready;
+    publishEvent('balance', { balanceEth, ready });
+  }
+}
+
+async function checkWatchedClaims() {
+  const now = Date.now();
+  for (const [claimId, watched] of watchedClaims) {
+    if (now - watched.addedAt > WATCHED_CLAIM_TTL) {
+      watchedClaims.delete(claimId);
+      continue;
+    }
+
+    try {
+      const claim = await claimClient.checkClaim(claimId);
+      if (claim.status !== watched.status) {
+        watched.status = claim.status;
+        publishEvent('claim_update', { claim_id: claimId, ...claim });
+      }
+      if (claim.status === 'completed') {
+        watchedClaims.delete(claimId);
+      }
+    } catch (error) {
+      console.warn(`⚠️ Could not check watched claim ${claimId}: ${error.message}`);
+    }
+  }
+}
+
+function startEventWatcher() {
+  if (eventWatcherInterval) return;
+
+  eventWatcherInterval = setInterval(async () => {
+    // Skip a tick rather than overlap when the RPC or claim server is slow
+    if (eventWatcherRunning) return;
+    eventWatcherRunning = true;
+    try {
+      if (!balanceReady) {
+        await checkWatchedBalance();
+      }
+      if (watchedClaims.size > 0) {
+        await checkWatchedClaims();
+      }
+    } catch (error) {
+      console.error('❌ Error in event watcher:', error);
+    } finally {
+      eventWatcherRunning = false;
+    }
+  }, EVENT_POLL_INTERVAL);
+}
+
+function stopEventWatcher() {
+  if (eventWatcherInterval) {
+    clearInterval(eventWatcherInterval);
+    eventWatcherInterval = null;
+  }
+}
+
 app.get('/health', (req, res) => {
   res.json({
     status: 'ok',
@@ -242,6 +334,61 @@ app.get('/health', (req, res) => {
   });
 });
 
+app.get('/api/events', (req, res) => {
+  res.set({
+    'Content-Type': 'text/event-stream',
+    'Cache-Control': 'no-cache',
+    'Connection': 'keep-alive'
+  });
+  res.flushHeaders();
+  res.write(': connected\n\n');
+
+  // A new device (or a reconnect) should hear the current balance again
+  lastBalanceEth = null;
+  balanceReady = false;
+
+  // Comment lines keep proxies and the client's read timeout from closing
+  // an idle stream
+  const heartbeat = setInterval(() => res.write(': ping\n\n'), 25000);
+
+  eventClients.add(res);
+  startEventWatcher();
+
+  req.on('close', () => {
+    clearInterval(heartbeat);
+    eventClients.delete(res);
+    if (eventClients.size === 0) {
+      stopEventWatcher();
+    }
+  });
+});
+
+// Devices report the claims they are still tracking whenever they
+// (re)connect, so claims created before the stream came up or before a
+// backend restart are pushed too, not only those from this process's uploads
+app.post('/api/events/watch', (req, res) => {
+  const { claim_ids } = req.body;
+
+  if (!Array.isArray(claim_ids)) {
+    return res.status(400).json({
+      success: false,
+      error: 'claim_ids must be an array'
+    });
+  }
+
+  for (const claimId of claim_ids) {
+    watchClaim(claimId);
+  }
+  if (eventClients.size > 0) {
+    startEventWatcher();
+  }
+
+  res.json({
+    success: true,
+    watching: claim_ids
+  });
+});
+
 app.get('/api/status', async (req, res) => {
   try {
     const claimHealth = await claimClient.healthCheck();
@@ -426,74 +573,143 @@ app.post('/api/device/register', async (req, res) => {
   }
 });
 
-app.post('/api/device/ensure-registered', async (req, res) => {
+// Checks on-chain registration for a device and registers/activates it as
+// needed. Shared by /api/device/ensure-registered and by uploads that carry
+// register_if_needed, so a cold-start capture needs only one request.
+async function ensureDeviceRegistered({
+  deviceAddress,
+  publicKey,
+  deviceId,
+  cameraId,
+  model,
+  firmwareVersion
+}) {
+  let registered = false;
+  let activated = false;
+  let registrationTx = null;
+  let activationTx = null;
+
+  // Step 1: Check if device is registered and active
+  console.log(`\n🔍 Step 1: Checking device registration status...`);
   try {
-    const {
-      deviceAddress,
-      publicKey,
-      deviceId,
-      cameraId,
-      model,
-      firmwareVersion
-    } = req.body;
+    // Use isDeviceActive which is more reliable
+    const isActive = await web3Service.isDeviceActive(deviceAddress);
+    console.log(`   📊 isDeviceActive result: ${isActive}`);
+    
+    if (isActive) {
+      // Device is registered and active
+      registered = true;
+      activated = true;
+      console.log(`   ✅ Device ${deviceAddress} is registered and active`);
+      
+      // Get full device info for logging
+      try {
+        const deviceInfo = await web3Service.getDeviceInfo(deviceAddress);
+        if (deviceInfo) {
+          console.log(`   📊 Registration details:`);
+          console.log(`      - Device ID: ${deviceInfo.deviceId}`);
+          console.log(`      - Model: ${deviceInfo.model}`);
+          console.log(`      - Firmware: ${deviceInfo.firmwareVersion}`);
+          console.log(`      - Registered by: ${deviceInfo.registeredBy}`);
+          console.log(`      - Registration time: ${new Date(Number(deviceInfo.registrationTime) * 1000).toISOString()}`);
+        }
+      } catch (e) {
+        // Ignore - we already know it's active
+      }
+    } else {
+      // Device is not active - check if it's registered at all
+      console.log(`   📊 Device is not active, checking registration status...`);
+      const deviceInfo = await web3Service.getDeviceInfo(deviceAddress);
+      
+      if (deviceInfo && deviceInfo.deviceAddress && deviceInfo.deviceAddress !== '0x0000000000000000000000000000000000000000') {
+        // Device is registered but inactive
+        registered = true;
+        activated = false;
+        console.log(`   ⚠️ Device ${deviceAddress} is registered but INACTIVE`);
+        console.log(`   🔄 Activating device...`);
+        
+        try {
+          // Activate the device
+          const updateResult = await web3Service.updateDevice(
+            deviceAddress,
+            firmwareVersion || '1.0.0',
+            true
+          );
+          activationTx = updateResult.txHash;
+          activated = true;
+          console.log(`   ✅ Activation transaction submitted: ${activationTx}`);
+          console.log(`   ⏳ Waiting for transaction confirmation...`);
+          console.log(`   ✅ Device ${deviceAddress} activated in block ${updateResult.blockNumber}`);
+        } catch (updateError) {
+          if (updateError.message?.includes('not registered')) {
+            console.warn(`   ⚠️ Activation failed: Device not registered (contract state mismatch)`);
+            console.warn(`   🔄 Will try to register device instead...`);
+            registered = false; // Mark as not registered so we register it
+          } else {
+            throw updateError;
+          }
+        }
+      } else {
+        console.log(`   ❌ Device ${deviceAddress} is NOT registered`);
+      }
+    }
+  } catch (error) {
+    // Device not registered or error checking
+    console.log(`   ❌ Error checking device status: ${error.message}`);
+    console.log(`   ℹ️ Assuming device is not registered`);
+  }
 
-    console.log(`\n📋 [DEVICE REGISTRATION] Starting for: ${deviceAddress}`);
+  // Step 3: Register if not registered
+  if (!registered) {
+    console.log(`\n📝 Step 3: Registering device...`);
+    console.log(`   Device Address: ${deviceAddress}`);
     console.log(`   Device ID: ${deviceId}`);
     console.log(`   Camera ID: ${cameraId}`);
-
-    if (!deviceAddress || !publicKey || !deviceId || !cameraId) {
-      return res.status(400).json({
-        success: false,
-        error: 'Missing required fields: deviceAddress, publicKey, deviceId, cameraId'
-      });
-    }
-
-    let registered = false;
-    let activated = false;
-    let registrationTx = null;
-    let activationTx = null;
-
-    // Step 1: Check if device is registered and active
-    console.log(`\n🔍 Step 1: Checking device registration status...`);
+    console.log(`   Model: ${model || 'Raspberry Pi'}`);
+    console.log(`   Firmware: ${firmwareVersion || '1.0.0'}`);
+    
     try {
-      // Use isDeviceActive which is more reliable
-      const isActive = await web3Service.isDeviceActive(deviceAddress);
-      console.log(`   📊 isDeviceActive result: ${isActive}`);
+      console.log(`   🔄 Calling registerDevice()...`);
+      const result = await web3Service.registerDevice({
+        deviceAddress,
+        publicKey,
+        deviceId,
+        cameraId,
+        model: model || 'Raspberry Pi',
+        firmwareVersion: firmwareVersion || '1.0.0'
+      });
+      
+      registrationTx = result.txHash;
+      registered = true;
+      activated = true; // Registration sets isActive to true
+      console.log(`   ✅ Registration transaction submitted: ${registrationTx}`);
+      console.log(`   ⏳ Waiting for transaction confirmation...`);
+      console.log(`   ✅ Device registered in block ${result.blockNumber}`);
+      console.log(`   ✅ Device is automatically set to ACTIVE on registration`);
+
+      // Cache device info in database
+      dbService.cacheDevice({
+        device_address: deviceAddress,
+        device_id: deviceId,
+        camera_id: cameraId,
+        public_key: publicKey,
+        is_registered: true
+      });
+      console.log(`   💾 Device info cached in database`);
+    } catch (error) {
+      console.log(`   ❌ Registration error: ${error.message}`);
       
-      if (isActive) {
-        // Device is registered and active
+      // Check if error is "already registered"
+      if (error.message?.includes('already registered') || error.message?.includes('Device already registered')) {
+        console.log(`   ℹ️ Device appears to be already registered (race condition?)`);
         registered = true;
-        activated = true;
-        console.log(`   ✅ Device ${deviceAddress} is registered and active`);
         
-        // Get full device info for logging
+        // Try to activate if not active
         try {
+          console.log(`   🔄 Re-checking device status...`);
           const deviceInfo = await web3Service.getDeviceInfo(deviceAddress);
-          if (deviceInfo) {
-            console.log(`   📊 Registration details:`);
-            console.log(`      - Device ID: ${deviceInfo.deviceId}`);
-            console.log(`      - Model: ${deviceInfo.model}`);
-            console.log(`      - Firmware: ${deviceInfo.firmwareVersion}`);
-            console.log(`      - Registered by: ${deviceInfo.registeredBy}`);
-            console.log(`      - Registration time: ${new Date(Number(deviceInfo.registrationTime) * 1000).toISOString()}`);
-          }
-        } catch (e) {
-          // Ignore - we already know it's active
-        }
-      } else {
-        // Device is not active - check if it's registered at all
-        console.log(`   📊 Device is not active, checking registration status...`);
-        const deviceInfo = await web3Service.getDeviceInfo(deviceAddress);
-        
-        if (deviceInfo && deviceInfo.deviceAddress && deviceInfo.deviceAddress !== '0x0000000000000000000000000000000000000000') {
-          // Device is registered but inactive
-          registered = true;
-          activated = false;
-          console.log(`   ⚠️ Device ${deviceAddress} is registered but INACTIVE`);
-          console.log(`   🔄 Activating device...`);
-          
-          try {
-            // Activate the device
+          if (deviceInfo && !deviceInfo.isActive) {
+            console.log(`   🔄 Device is registered but inactive, activating...`);
             const updateResult = await web3Service.updateDevice(
               deviceAddress,
               firmwareVersion || '1.0.0',
@@ -501,110 +717,124 @@ app.post('/api/device/ensure-registered', async (req, res) => {
             );
             activationTx = updateResult.txHash;
             activated = true;
-            console.log(`   ✅ Activation transaction submitted: ${activationTx}`);
-            console.log(`   ⏳ Waiting for transaction confirmation...`);
-            console.log(`   ✅ Device ${deviceAddress} activated in block ${updateResult.blockNumber}`);
-          } catch (updateError) {
-            if (updateError.message?.includes('not registered')) {
-              console.warn(`   ⚠️ Activation failed: Device not registered (contract state mismatch)`);
-              console.warn(`   🔄 Will try to register device instead...`);
-              registered = false; // Mark as not registered so we register it
-            } else {
-              throw updateError;
-            }
+            console.log(`   ✅ Activation transaction: ${activationTx}`);
+          } else if (deviceInfo && deviceInfo.isActive) {
+            activated = true;
+            console.log(`   ✅ Device is already active`);
           }
-        } else {
-          console.log(`   ❌ Device ${deviceAddress} is NOT registered`);
+        } catch (e) {
+          console.error(`   ❌ Error checking/activating device: ${e.message}`);
         }
+      } else {
+        throw error;
       }
-    } catch (error) {
-      // Device not registered or error checking
-      console.log(`   ❌ Error checking device status: ${error.message}`);
-      console.log(`   ℹ️ Assuming device is not registered`);
     }
+  }
 
-    // Step 3: Register if not registered
-    if (!registered) {
-      console.log(`\n📝 Step 3: Registering device...`);
-      console.log(`   Device Address: ${deviceAddress}`);
-      console.log(`   Device ID: ${deviceId}`);
-      console.log(`   Camera ID: ${cameraId}`);
-      console.log(`   Model: ${model || 'Raspberry Pi'}`);
-      console.log(`   Firmware: ${firmwareVersion || '1.0.0'}`);
-      
-      try {
-        console.log(`   🔄 Calling registerDevice()...`);
-        const result = await web3Service.registerDevice({
-          deviceAddress,
-          publicKey,
-          deviceId,
-          cameraId,
-          model: model || 'Raspberry Pi',
-          firmwareVersion: firmwareVersion || '1.0.0'
-        });
-        
-        registrationTx = result.txHash;
-        registered = true;
-        activated = true; // Registration sets isActive to true
-        console.log(`   ✅ Registration transaction submitted: ${registrationTx}`);
-        console.log(`   ⏳ Waiting for transaction confirmation...`);
-        console.log(`   ✅ Device registered in block ${result.blockNumber}`);
-        console.log(`   ✅ Device is automatically set to ACTIVE on registration`);
-
-        // Cache device info in database
-        dbService.cacheDevice({
-          device_address: deviceAddress,
-          device_id: deviceId,
-          camera_id: cameraId,
-          public_key: publicKey,
-          is_registered: true
-        });
-        console.log(`   💾 Device info cached in database`);
-      } catch (error) {
-        console.log(`   ❌ Registration error: ${error.message}`);
-        
-        // Check if error is "already registered"
-        if (error.message?.includes('already registered') || error.message?.includes('Device already registered')) {
-          console.log(`   ℹ️ Device appears to be already registered (race condition?)`);
-          registered = true;
-          
-          // Try to activate if not active
-          try {
-            console.log(`   🔄 Re-checking device status...`);
-            const deviceInfo = await web3Service.getDeviceInfo(deviceAddress);
-            if (deviceInfo && !deviceInfo.isActive) {
-              console.log(`   🔄 Device is registered but inactive, activating...`);
-              const updateResult = await web3Service.updateDevice(
-                deviceAddress,
-                firmwareVersion || '1.0.0',
-                true
-              );
-              activationTx = updateResult.txHash;
-              activated = true;
-              console.log(`   ✅ Activation transaction: ${activationTx}`);
-            } else if (deviceInfo && deviceInfo.isActive) {
-              activated = true;
-              console.log(`   ✅ Device is already active`);
-            }
-          } catch (e) {
-            console.error(`   ❌ Error checking/activating device: ${e.message}`);
-          }
-        } else {
-          throw error;
-        }
+  console.log(`\n📊 [DEVICE REGISTRATION] Summary:`);
+  console.log(`   Registered: ${registered ? '✅' : '❌'}`);
+  console.log(`   Active: ${activated ? '✅' : '❌'}`);
+  if (registrationTx) {
+    console.log(`   Registration TX: ${registrationTx}`);
+  }
+  if (activationTx) {
+    console.log(`   Activation TX: ${activationTx}`);
+  }
+  console.log(`✅ [DEVICE REGISTRATION] Complete\n`);
+
+  return { registered, activated, registrationTx, activationTx };
+}
+
+// One ensureDeviceRegistered() run per device address at a time, shared by
+// /api/device/ensure-registered and uploads carrying register_if_needed.
+// Two concurrent runs would both see the device unregistered and both submit
+// registerDevice/updateDevice, with the loser reverting. Each run's outcome
+// is pushed as a 'registration' event; a successful one is kept so later
+// uploads from the device can return it without touching the chain.
+const deviceRegistrations = new Map();
+
+function runDeviceRegistration(details, { refresh = false } = {}) {
+  const key = details.deviceAddress.toLowerCase();
+  const existing = deviceRegistrations.get(key);
+  if (existing && (existing.result === null || !refresh)) {
+    return existing;
+  }
+
+  const entry = { result: null, promise: null };
+  deviceRegistrations.set(key, entry);
+
+  entry.promise = ensureDeviceRegistered(details)
+    .then((result) => {
+      if (result.registered && result.activated) {
+        entry.result = result;
+      } else if (deviceRegistrations.get(key) === entry) {
+        // Let the next request try again
+        deviceRegistrations.delete(key);
       }
-    }
+      publishEvent('registration', { deviceAddress: details.deviceAddress, ...result });
+      return result;
+    })
+    .catch((error) => {
+      if (deviceRegistrations.get(key) === entry) {
+        deviceRegistrations.delete(key);
+      }
+      publishEvent('registration', {
+        deviceAddress: details.deviceAddress,
+        registered: false,
+        activated: false,
+        error: error.message
+      });
+      throw error;
+    });
 
-    console.log(`\n📊 [DEVICE REGISTRATION] Summary:`);
-    console.log(`   Registered: ${registered ? '✅' : '❌'}`);
-    console.log(`   Active: ${activated ? '✅' : '❌'}`);
-    if (registrationTx) {
-      console.log(`   Registration TX: ${registrationTx}`);
-    }
-    if (activationTx) {
-      console.log(`   Activation TX: ${activationTx}`);
+  return entry;
+}
+
+// Waiting for on-chain confirmations can outlast the device's upload
+// timeout, so uploads never await the registration they start
+function startUploadRegistration(details) {
+  const entry = runDeviceRegistration(details);
+  if (entry.result) {
+    return entry.result;
+  }
+  entry.promise.catch((error) => {
+    console.warn(`   ⚠️ Background device registration failed: ${error.message}`);
+  });
+  return { pending: true };
+}
+
+app.post('/api/device/ensure-registered', async (req, res) => {
+  try {
+    const {
+      deviceAddress,
+      publicKey,
+      deviceId,
+      cameraId,
+      model,
+      firmwareVersion
+    } = req.body;
+
+    console.log(`\n📋 [DEVICE REGISTRATION] Starting for: ${deviceAddress}`);
+    console.log(`   Device ID: ${deviceId}`);
+    console.log(`   Camera ID: ${cameraId}`);
+
+    if (!deviceAddress || !publicKey || !deviceId || !cameraId) {
+      return res.status(400).json({
+        success: false,
+        error: 'Missing required fields: deviceAddress, publicKey, deviceId, cameraId'
+      });
     }
-    console.log(`✅ [DEVICE REGISTRATION] Complete\n`);
+
+    // Joins a registration an upload already started rather than racing it;
+    // with none in flight it re-checks the chain instead of a cached result
+    const { registered, activated, registrationTx, activationTx } = await runDeviceRegistration({
+      deviceAddress,
+      publicKey,
+      deviceId,
+      cameraId,
+      model,
+      firmwareVersion
+    }, { refresh: true }).promise;
 
     res.json({
       success: true,
@@ -706,6 +936,23 @@ app.post('/api/images/upload', upload.single('image'), async (req, res) => {
       });
     }
 
+    // Cold-start devices send their registration details with the first
+    // upload instead of making a separate ensure-registered call. The
+    // registration runs in the background; see startUploadRegistration().
+    let registration = null;
+    if (req.body.register_if_needed) {
+      try {
+        const details = JSON.parse(req.body.register_if_needed);
+        registration = startUploadRegistration({
+          ...details,
+          deviceAddress,
+          cameraId
+        });
+      } catch (error) {
+        console.warn(`   ⚠️ Invalid register_if_needed field: ${error.message}`);
+      }
+    }
+
     const filename = `photo_${Date.now()}.jpg`;
     const filepath = path.join(CAPTURES_PATH, filename);
     fs.renameSync(req.file.path, filepath);
@@ -785,6 +1032,7 @@ app.post('/api/images/upload', upload.single('image'), async (req, res) => {
             claim_id: claimId
           });
 
+          watchClaim(claimId);
           console.log(`   ✅ Claim created: ${claimId}`);
           console.log(`   ✅ Claim URL: ${claimUrl}`);
 
@@ -933,7 +1181,8 @@ app.post('/api/images/upload', upload.single('image'), async (req, res) => {
       claimId: claimId || null,
       claimUrl: claimUrl || null,
       qrCodeUrl: claimUrl || null, // Same as claimUrl for QR code
-      status: filecoinCid ? 'uploaded' : 'saved'
+      status: filecoinCid ? 'uploaded' : 'saved',
+      registration
     });
   } catch (error) {
     console.error('❌ Image upload failed:', error);
@@ -1060,6 +1309,41 @@ app.get('/api/claims/check', async (req, res) => {
   }
 });
 
+app.post('/api/claims/check_batch', async (req, res) => {
+  try {
+    const { claim_ids } = req.body;
+
+    if (!Array.isArray(claim_ids) || claim_ids.length === 0) {
+      return res.status(400).json({
+        success: false,
+        error: 'claim_ids must be a non-empty array'
+      });
+    }
+
+    // One request from the device; the claim server lookups run concurrently
+    const results = await Promise.allSettled(
+      claim_ids.map(claim_id => claimClient.checkClaim(claim_id))
+    );
+
+    const claims = results.map((result, i) => (
+      result.status === 'fulfilled'
+        ? { claim_id: claim_ids[i], ...result.value }
+        : { claim_id: claim_ids[i], success: false, error: result.reason.message }
+    ));
+
+    res.json({
+      success: true,
+      claims
+    });
+  } catch (error) {
+    console.error('❌ Error checking claims:', error);
+    res.status(500).json({
+      success: false,
+      error: error.message
+    });
+  }
+});
+
 app.get('/status', (req, res) => {
   res.json({
     success: true,
@@ -1280,6 +1564,9 @@ async function startServer() {
     console.log(`   - GET  /api/images/list`);
     console.log(`   - GET  /api/images/:id`);
     console.log(`   - GET  /api/claims/check`);
+    console.log(`   - POST /api/claims/check_batch`);
+    console.log(`   - GET  /api/events`);
+    console.log(`   - POST /api/events/watch`);
     console.log(`   - GET  /api/proofs/:claim_id`);
     console.log(`   - GET  /api/proofs/token/:token_id`);
     console.log(`   - POST /api/privy/create-session-signer`);
@@ -1294,6 +1581,7 @@ process.on('SIGINT', () => {
   if (claimPollingInterval) {
     clearInterval(claimPollingInterval);
   }
+  stopEventWatcher();
 
   dbService.close();
   process.exit(0);